@@ -0,0 +1,63 @@
+"""
+Microbenchmark of the color math used to build themes.
+
+Compares the integer ``Colors.brightness`` implementation with the previous ``colorsys`` implementation, with and
+without memoization, and the bulk ``Colors.derive`` api against deriving the same colors one call at a time.
+
+    python benchmarks/color_math.py
+"""
+import json
+import colorsys
+import importlib.resources
+from timeit import timeit
+
+from ttkbootstrap import Colors, _brightness, _hex_to_int_rgb
+
+
+def colorsys_brightness(hex_color, pct_change):
+    """
+    The previous implementation of ``Colors.brightness``
+    """
+    r, g, b = (round(int(hex_color[i:i + 2], 16) / 255, 2) for i in (1, 3, 5))
+    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    v_ = min(1, max(0, (1 + pct_change) * v))
+    r_, g_, b_ = colorsys.hsv_to_rgb(h, s, v_)
+    return '#{:02x}{:02x}{:02x}'.format(int(r_ * 255), int(g_ * 255), int(b_ * 255))
+
+
+def uncached_brightness(hex_color, pct_change):
+    return _brightness.__wrapped__(hex_color, pct_change)
+
+
+def theme_palettes():
+    themes = json.loads(importlib.resources.read_text('ttkbootstrap', 'themes.json'))['themes']
+    return [Colors(**theme['colors']) for theme in themes]
+
+
+def main(number=20):
+    palettes = theme_palettes()
+    pcts = (-0.2, -0.1, -0.05)
+    calls = [(palette.get(label), pct) for palette in palettes for label in palette.label_iter() for pct in pcts]
+
+    def run(func):
+        for color, pct in calls:
+            func(color, pct)
+
+    def run_derive():
+        for palette in palettes:
+            palette.derive(pcts)
+
+    results = {
+        'colorsys': timeit(lambda: run(colorsys_brightness), number=number),
+        'integer': timeit(lambda: (_hex_to_int_rgb.cache_clear(), run(uncached_brightness)), number=number),
+        'integer + lru_cache': timeit(lambda: run(Colors.brightness), number=number),
+        'derive (bulk)': timeit(run_derive, number=number)}
+
+    baseline = results['colorsys']
+    print(f'{len(calls)} brightness adjustments x {number} runs')
+    for name, seconds in results.items():
+        print(f'{name:>20}: {seconds / number * 1000:8.3f} ms per run  {baseline / seconds:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
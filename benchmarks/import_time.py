@@ -0,0 +1,91 @@
+"""
+Import time check for ttkbootstrap.
+
+Runs ``python -X importtime -c "import ttkbootstrap"`` in fresh interpreters, reports the cumulative import time and the
+slowest modules imported on behalf of ttkbootstrap, and fails when a module that should only be imported on first use
+is imported, or when the median import time exceeds a limit. It does not need a display, so it can run in CI::
+
+    python benchmarks/import_time.py --max-ms 40
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+# modules that ttkbootstrap imports on first use only
+DEFERRED = ('PIL', 'json', 'hashlib', 'base64', 'importlib.resources')
+
+
+def import_times():
+    """
+    Import ttkbootstrap in a fresh interpreter
+
+    :returns: the self and cumulative import time in microseconds of every imported module
+    :rtype: dict
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC), env.get('PYTHONPATH')]))
+    # tkinter is imported by the interpreter beforehand, so that only the cost of ttkbootstrap itself is reported
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import tkinter.ttk; import ttkbootstrap'],
+                            env=env, check=True, stderr=subprocess.PIPE, universal_newlines=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def imported_modules(times):
+    """
+    The modules imported on behalf of ttkbootstrap, which are the modules imported after tkinter
+
+    :param dict times: the import times returned by ``import_times``
+
+    :rtype: list
+    """
+    names = list(times)
+    return names[names.index('tkinter.ttk') + 1:]
+
+
+def deferred_imports(modules):
+    """
+    The modules of ``DEFERRED`` that are imported, with or without their submodules
+
+    :param modules: the names of the imported modules
+
+    :rtype: list
+    """
+    return [name for name in DEFERRED if any(module == name or module.startswith(f'{name}.') for module in modules)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ttkbootstrap import time check')
+    parser.add_argument('--runs', type=int, default=5, help='the number of fresh interpreters to measure')
+    parser.add_argument('--max-ms', type=float, help='fail when the median import time exceeds this many milliseconds')
+    parser.add_argument('--top', type=int, default=10, help='the number of slowest modules to show')
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    median = statistics.median(times['ttkbootstrap'][1] for times in runs) / 1000
+    print(f'import ttkbootstrap: {median:.2f} ms median of {args.runs} runs')
+    modules = imported_modules(runs[-1])
+    for name in sorted(modules, key=lambda name: -runs[-1][name][0])[:args.top]:
+        print(f'{runs[-1][name][0] / 1000:>10.2f} ms  {name}')
+
+    failures = [f'{name} is imported' for name in deferred_imports(modules)]
+    if args.max_ms is not None and median > args.max_ms:
+        failures.append(f'the import takes longer than {args.max_ms} ms')
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
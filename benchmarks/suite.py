@@ -0,0 +1,314 @@
+"""
+Benchmark suite for startup and theme switching.
+
+Measures the time to import ttkbootstrap, to construct a ``Style`` with an empty and with a warm theme cache, to build
+each theme in ``themes.json``, and to switch between every pair of themes, as well as the peak resident memory of each
+stage. A library of synthetic user themes is built and switched through as well. Each stage runs in a fresh
+interpreter, so the measurements do not influence each other.
+
+When there is no display, the suite starts its own Xvfb server. Results are written as JSON, and two result files can
+be compared to flag regressions::
+
+    python benchmarks/suite.py run --output before.json
+    python benchmarks/suite.py run --output after.json
+    python benchmarks/suite.py compare before.json after.json --threshold 0.1
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from contextlib import contextmanager
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# workers; each runs in its own interpreter and prints its results as json
+# ---------------------------------------------------------------------------------------------------------------------
+
+def peak_rss_kb():
+    """
+    The peak resident memory of this process in kilobytes
+    """
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def worker_import():
+    start = time.perf_counter()
+    import ttkbootstrap  # noqa: F401
+    return {'seconds': time.perf_counter() - start, 'peak_rss_kb': peak_rss_kb()}
+
+
+def worker_style():
+    import tkinter
+    from ttkbootstrap import Style
+    root = tkinter.Tk()
+    start = time.perf_counter()
+    Style(master=root)
+    root.update_idletasks()
+    seconds = time.perf_counter() - start
+    root.destroy()
+    return {'seconds': seconds, 'peak_rss_kb': peak_rss_kb()}
+
+
+def synthetic_definitions(count, seed=0):
+    """
+    A reproducible library of user themes with random palettes
+    """
+    from ttkbootstrap import Colors, ThemeDefinition
+    rng = random.Random(seed)
+
+    def color(low=0, high=255):
+        return '#{:02x}{:02x}{:02x}'.format(*(rng.randint(low, high) for _ in range(3)))
+
+    definitions = []
+    for i in range(count):
+        themetype = 'light' if i % 2 == 0 else 'dark'
+        bg, fg = (color(224, 255), color(0, 80)) if themetype == 'light' else (color(0, 48), color(192, 255))
+        colors = Colors(
+            primary=color(), secondary=color(), success=color(), info=color(), warning=color(), danger=color(),
+            bg=bg, fg=fg, selectbg=color(), selectfg=color(), light=color(160, 255), border=color(), inputfg=fg)
+        definitions.append(ThemeDefinition(f'synthetic{i:03d}', themetype, 'Helvetica 10', colors))
+    return definitions
+
+
+def sample_form(root):
+    """
+    A form of ttk and tk widgets, so that switching themes includes restyling and redrawing widgets
+    """
+    import tkinter
+    from tkinter import ttk
+    frame = ttk.Frame(root, padding=10)
+    frame.pack(fill='both', expand=True)
+    for color in ('primary', 'secondary', 'success', 'info', 'warning', 'danger'):
+        ttk.Button(frame, text=color, style=f'{color}.TButton').pack(fill='x')
+        ttk.Checkbutton(frame, text=color, style=f'{color}.TCheckbutton').pack(fill='x')
+    ttk.Entry(frame).pack(fill='x')
+    ttk.Combobox(frame, values=['one', 'two']).pack(fill='x')
+    ttk.Scale(frame, style='info.Horizontal.TScale').pack(fill='x')
+    ttk.Treeview(frame, height=3).pack(fill='x')
+    tkinter.Text(frame, height=3).pack(fill='x')
+    tkinter.Listbox(frame, height=3).pack(fill='x')
+    root.update()
+
+
+def measure_themes(style, root, themenames, pairs):
+    """
+    Build each theme and switch between the pairs of themes
+
+    :returns: the build time of each theme and statistics of the switch latency
+    """
+    build = {}
+    for themename in themenames:
+        start = time.perf_counter()
+        style._build_theme(themename)
+        build[themename] = time.perf_counter() - start
+
+    switches = []
+    for old, new in pairs:
+        style.theme_use(old)
+        root.update()
+        start = time.perf_counter()
+        style.theme_use(new)
+        root.update_idletasks()
+        switches.append(time.perf_counter() - start)
+
+    return {
+        'build': build,
+        'build_total': sum(build.values()),
+        'switch': {
+            'pairs': len(switches),
+            'mean': statistics.mean(switches),
+            'median': statistics.median(switches),
+            'max': max(switches)}}
+
+
+def worker_builtin():
+    import tkinter
+    from ttkbootstrap import Style, read_theme_settings
+    root = tkinter.Tk()
+    # start with a theme of Tk, so that every ttkbootstrap theme is built by the benchmark
+    style = Style('clam', master=root, cache=False)
+    sample_form(root)
+    themenames = [theme['name'] for theme in read_theme_settings()]
+    pairs = [(old, new) for old in themenames for new in themenames if old != new]
+    result = measure_themes(style, root, themenames, pairs)
+    result['peak_rss_kb'] = peak_rss_kb()
+    root.destroy()
+    return result
+
+
+def worker_synthetic(count=200):
+    import tkinter
+    from ttkbootstrap import Style, ThemeRegistry
+    root = tkinter.Tk()
+    style = Style('clam', master=root, cache=False)
+    sample_form(root)
+    registry = ThemeRegistry.get(root)
+    definitions = synthetic_definitions(count)
+    for definition in definitions:
+        registry.definitions[definition.name] = definition
+    themenames = [definition.name for definition in definitions]
+    # every pair of a large library is too many; each theme is switched to from the previous one
+    pairs = list(zip(themenames, themenames[1:] + themenames[:1]))
+    result = measure_themes(style, root, themenames, pairs)
+    result['themes'] = count
+    result['peak_rss_kb'] = peak_rss_kb()
+    root.destroy()
+    return result
+
+
+WORKERS = {
+    'import': worker_import,
+    'style': worker_style,
+    'builtin': worker_builtin,
+    'synthetic': worker_synthetic}
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# driver
+# ---------------------------------------------------------------------------------------------------------------------
+
+@contextmanager
+def display():
+    """
+    Start an Xvfb server for the duration of the suite when there is no display
+    """
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        yield os.environ.get('DISPLAY')
+        return
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        raise SystemExit('there is no display; set DISPLAY or install Xvfb')
+    number = next(n for n in range(99, 1000) if not Path(f'/tmp/.X{n}-lock').exists())
+    server = subprocess.Popen([xvfb, f':{number}', '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while not Path(f'/tmp/.X11-unix/X{number}').exists():
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise SystemExit('Xvfb did not start')
+            time.sleep(0.05)
+        os.environ['DISPLAY'] = f':{number}'
+        yield os.environ['DISPLAY']
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_worker(name, env=None):
+    """
+    Run a worker in a fresh interpreter
+
+    :returns: the results of the worker
+    :rtype: dict
+    """
+    env = dict(os.environ, **(env or {}))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC), env.get('PYTHONPATH')]))
+    output = subprocess.run([sys.executable, __file__, 'worker', name], env=env, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def repeated(name, runs, env=None):
+    """
+    Run a worker several times and summarize the timings
+    """
+    results = [run_worker(name, env() if callable(env) else env) for _ in range(runs)]
+    seconds = [result['seconds'] for result in results]
+    return {
+        'runs': runs,
+        'min': min(seconds),
+        'median': statistics.median(seconds),
+        'peak_rss_kb': max(result['peak_rss_kb'] for result in results)}
+
+
+def run(args):
+    import tkinter
+    with display() as screen, tempfile.TemporaryDirectory() as tmp:
+        warm_cache = os.path.join(tmp, 'warm')
+        run_worker('style', {'TTKBOOTSTRAP_CACHE_DIR': warm_cache})
+        cold_runs = iter(range(args.runs))
+        results = {
+            'meta': {
+                'python': platform.python_version(),
+                'tk': str(tkinter.TkVersion),
+                'platform': platform.platform(),
+                'display': screen,
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'import': repeated('import', args.runs),
+            'style_cold': repeated('style', args.runs,
+                                   lambda: {'TTKBOOTSTRAP_CACHE_DIR': os.path.join(tmp, f'cold{next(cold_runs)}')}),
+            'style_warm': repeated('style', args.runs, {'TTKBOOTSTRAP_CACHE_DIR': warm_cache}),
+            'builtin': run_worker('builtin'),
+            'synthetic': run_worker('synthetic')}
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f'results written to {args.output}')
+
+
+def metrics(results, prefix=''):
+    """
+    Flatten the numeric results into metric paths, e.g. ``builtin.switch.median``
+    """
+    for key, value in results.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            yield from metrics(value, f'{path}.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and not path.startswith('meta.'):
+            yield path, value
+
+
+def compare(args):
+    base = dict(metrics(json.loads(Path(args.base).read_text(encoding='utf-8'))))
+    new = dict(metrics(json.loads(Path(args.new).read_text(encoding='utf-8'))))
+    regressions = []
+    print(f"{'metric':<48}{'base':>14}{'new':>14}{'change':>10}")
+    for path in sorted(base.keys() & new.keys()):
+        if path.endswith(('runs', 'pairs', 'themes')) or not base[path]:
+            continue
+        change = new[path] / base[path] - 1
+        flag = ''
+        if change > args.threshold:
+            flag = '  regression'
+            regressions.append(path)
+        print(f'{path:<48}{base[path]:>14.6g}{new[path]:>14.6g}{change:>+10.1%}{flag}')
+    if regressions:
+        print(f'{len(regressions)} regressions over {args.threshold:.0%}')
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ttkbootstrap startup and theme switching benchmarks')
+    commands = parser.add_subparsers(dest='command')
+    command = commands.add_parser('run', help='run the benchmarks')
+    command.add_argument('--output', default='benchmark.json', help='the result file')
+    command.add_argument('--runs', type=int, default=5, help='the number of runs of the startup benchmarks')
+    command = commands.add_parser('compare', help='compare two result files')
+    command.add_argument('base')
+    command.add_argument('new')
+    command.add_argument('--threshold', type=float, default=0.1, help='the relative slowdown flagged as regression')
+    command = commands.add_parser('worker')
+    command.add_argument('name', choices=WORKERS)
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    elif args.command == 'compare':
+        compare(args)
+    elif args.command == 'worker':
+        print(json.dumps(WORKERS[args.name]()))
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
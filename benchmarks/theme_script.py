@@ -0,0 +1,71 @@
+"""
+Benchmark of creating the ttk themes from their settings dictionary against creating them from a pre-formatted
+settings script, as a cached theme does.
+
+Both paths cross into Tcl once per theme; the difference is the Python time spent formatting the settings dictionary
+into a Tcl script, which the theme cache saves. Requires a display.
+
+    python benchmarks/theme_script.py
+"""
+import json
+import importlib.resources
+from time import perf_counter
+import tkinter
+from tkinter import ttk
+
+from ttkbootstrap import Colors, StylerTTK, ThemeDefinition
+
+
+def theme_definitions():
+    themes = json.loads(importlib.resources.read_text('ttkbootstrap', 'themes.json'))['themes']
+    return [ThemeDefinition(theme['name'], theme['type'], theme['font'], Colors(**theme['colors']))
+            for theme in themes]
+
+
+def main(number=5):
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        print(f'a display is required: {e}')
+        return
+    root.withdraw()
+    style = ttk.Style(root)
+
+    stylers = []
+    for definition in theme_definitions():
+        styler = StylerTTK(style, definition, build=False)
+        styler.update_ttk_theme_settings()
+        stylers.append(styler)
+    scripts = [styler.theme_script() for styler in stylers]
+
+    def create_from_settings(run):
+        for styler in stylers:
+            style.theme_create(f'{styler.theme.name}_settings_{run}', 'clam', styler.settings)
+
+    def format_scripts():
+        for styler in stylers:
+            ttk._script_from_settings(styler.settings)
+
+    def create_from_script(run):
+        for styler, script in zip(stylers, scripts):
+            style.tk.call('ttk::style', 'theme', 'create', f'{styler.theme.name}_script_{run}', '-parent', 'clam',
+                          '-settings', script)
+
+    results = {}
+    for name, func in (('theme_create(settings)', create_from_settings),
+                       ('format settings only', lambda run: format_scripts()),
+                       ('pre-formatted script', create_from_script)):
+        start = perf_counter()
+        for run in range(number):
+            func(run)
+        results[name] = (perf_counter() - start) / number
+
+    baseline = results['theme_create(settings)']
+    print(f'{len(stylers)} themes, {sum(map(len, scripts)) // len(scripts)} characters per script, {number} runs')
+    for name, seconds in results.items():
+        print(f'{name:>24}: {seconds * 1000:8.3f} ms per run  {baseline / seconds:6.1f}x')
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark of creating screens of styled widgets, like ``tests/color_variations.py`` but larger.
+
+For every theme, ``--count`` widgets are created for each widget style in the base style and in every color variant.
+Each batch is measured in four phases: creating the widgets, laying them out, drawing them for the first time, and
+destroying them. The Tcl commands of each phase are counted with ``TclTracer``, so the timings include the small
+overhead of counting. The results show which generated styles and layouts are expensive to instantiate. Requires a
+display; on a machine without one, run it under ``xvfb-run``::
+
+    python benchmarks/widgets.py --count 200 --theme flatly --output widgets.json
+    xvfb-run -a python benchmarks/widgets.py --count 200 --theme flatly --output widgets.json
+"""
+import json
+import argparse
+import tkinter
+from time import perf_counter
+from tkinter import ttk
+
+from ttkbootstrap import Colors, Style, TclTracer, read_theme_settings
+
+
+def make_button(parent, style, i):
+    return ttk.Button(parent, text=f'Button {i}', style=style)
+
+
+def make_checkbutton(parent, style, i):
+    return ttk.Checkbutton(parent, text=f'Option {i}', style=style)
+
+
+def make_radiobutton(parent, style, i):
+    return ttk.Radiobutton(parent, value=i, text=f'Option {i}', style=style)
+
+
+def make_entry(parent, style, i):
+    entry = ttk.Entry(parent, style=style)
+    entry.insert('end', f'Entry {i}')
+    return entry
+
+
+def make_spinbox(parent, style, i):
+    spinbox = ttk.Spinbox(parent, from_=1, to=100, style=style)
+    spinbox.set(i)
+    return spinbox
+
+
+def make_combobox(parent, style, i):
+    return ttk.Combobox(parent, values=['one', 'two', 'three'], style=style)
+
+
+def make_label(parent, style, i):
+    return ttk.Label(parent, text=f'Label {i}', style=style)
+
+
+def make_scale(parent, style, i):
+    return ttk.Scale(parent, from_=1, to=100, value=25, style=style)
+
+
+def make_vertical_scale(parent, style, i):
+    return ttk.Scale(parent, from_=1, to=100, value=25, orient='vertical', style=style)
+
+
+def make_progressbar(parent, style, i):
+    return ttk.Progressbar(parent, value=50, style=style)
+
+
+def make_treeview(parent, style, i):
+    treeview = ttk.Treeview(parent, height=1, style=style)
+    treeview.heading('#0', text=f'Heading {i}')
+    return treeview
+
+
+def make_menubutton(parent, style, i):
+    return ttk.Menubutton(parent, text=f'Menu {i}', style=style)
+
+
+# the widget factory of each style; ``{color}`` is replaced by each color variant
+WIDGET_STYLES = {
+    'TButton': make_button,
+    'Outline.TButton': make_button,
+    'TMenubutton': make_menubutton,
+    'Outline.TMenubutton': make_menubutton,
+    'TCheckbutton': make_checkbutton,
+    'TRadiobutton': make_radiobutton,
+    'TEntry': make_entry,
+    'TSpinbox': make_spinbox,
+    'TCombobox': make_combobox,
+    'TLabel': make_label,
+    'Horizontal.TScale': make_scale,
+    'Vertical.TScale': make_vertical_scale,
+    'Horizontal.TProgressbar': make_progressbar,
+    'Treeview': make_treeview}
+
+
+def measure(root, factory, style, count):
+    """
+    Create, lay out, draw and destroy a batch of widgets
+
+    :returns: the seconds and Tcl calls of each phase
+    :rtype: dict
+    """
+    frame = ttk.Frame(root)
+    frame.pack(fill='both', expand=True)
+    result = {}
+
+    def phase(name, func):
+        with TclTracer(root) as tracer:
+            start = perf_counter()
+            value = func()
+            seconds = perf_counter() - start
+        result[name] = {'seconds': seconds, 'calls': tracer.total}
+        return value
+
+    columns = max(1, int(count ** 0.5))
+    widgets = phase('create', lambda: [factory(frame, style, i) for i in range(count)])
+    phase('layout', lambda: ([widget.grid(row=i // columns, column=i % columns) for i, widget in enumerate(widgets)],
+                             root.update_idletasks()))
+    phase('paint', root.update)
+    phase('destroy', lambda: (frame.destroy(), root.update_idletasks()))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='styled ttk widget creation benchmark')
+    parser.add_argument('--count', type=int, default=100, help='the number of widgets per style')
+    parser.add_argument('--theme', action='append', dest='themes', metavar='NAME',
+                        help='a theme to measure; may be repeated. All themes by default.')
+    parser.add_argument('--output', help='write the results to this json file')
+    args = parser.parse_args()
+
+    root = tkinter.Tk()
+    root.geometry('1200x900')
+    style = Style(master=root)
+    themenames = args.themes or [theme['name'] for theme in read_theme_settings()]
+    results = {}
+    for themename in themenames:
+        style.theme_use(themename)
+        root.update()
+        for base, factory in WIDGET_STYLES.items():
+            for color in [None, *Colors()]:
+                stylename = f'{color}.{base}' if color else base
+                results.setdefault(stylename, {})[themename] = measure(root, factory, stylename, args.count)
+    root.destroy()
+
+    # the cost of each style, summed over the themes, per widget
+    phases = ('create', 'layout', 'paint', 'destroy')
+    print(f"{'microseconds / calls per widget':<36}" + ''.join(f'{phase:>19}' for phase in phases))
+    widgets = args.count * len(themenames)
+    for stylename, themes in results.items():
+        line = f'{stylename:<36}'
+        for phase in phases:
+            seconds = sum(theme[phase]['seconds'] for theme in themes.values())
+            calls = sum(theme[phase]['calls'] for theme in themes.values())
+            line += f'{seconds / widgets * 1e6:>12.1f}{calls / widgets:>7.1f}'
+        print(line)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'count': args.count, 'styles': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -32,5 +32,6 @@ setuptools.setup(
     package_data={"": ["*.json"]},
     include_package_data=True,
     install_requires=["pillow"],
+    extras_require={"batch": ["numpy"]},
     python_requires=">=3.6",
 )
\ No newline at end of file
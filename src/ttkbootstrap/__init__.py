@@ -25,12 +25,18 @@
     versions when they exist), they are available if needed, and shouldn't look completely out-of-place in your
     ttkbootstrap themed application.
 """
-import json
-import colorsys
+import os
+import re
+import sys
+import time
+import gc
 from pathlib import Path
-import importlib.resources
+from functools import lru_cache
+from contextlib import contextmanager
+import tkinter
 from tkinter import ttk
-from PIL import ImageTk, Image, ImageDraw
+
+__version__ = '0.0.31'
 
 
 class Style(ttk.Style):
@@ -38,50 +44,372 @@ class Style(ttk.Style):
     A class for setting the application style.
     """
 
-    def __init__(self, theme='flatly', *args, **kwargs):
+    # answer queries of the options set by ttkbootstrap themes from their settings; see ``_mirrored_value``
+    mirror_queries = True
+
+    # widget families and color variants built by each build profile
+    build_profiles = {
+        'full': {'families': None, 'variants': None},
+        'minimal': {'families': None, 'variants': ()}}
+
+    def __init__(self, theme='flatly', *args, cache=True, prebuild=False, prebuild_budget=10,
+                 prebuild_priority=None, build_profile='full', families=None, variants=None, max_resident_themes=None,
+                 bundle=None, **kwargs):
         """
         :param str theme: the name of the theme to use at runtime; *flatly* by default.
-        """
+        :param cache: reuse theme settings compiled by a previous run; either a bool or a ``ThemeCache`` instance.
+        :param bool prebuild: build the other themes in the background while the application is idle, so that
+            switching themes is instant.
+        :param int prebuild_budget: the maximum number of milliseconds spent building themes per idle callback.
+        :param prebuild_priority: a function that receives the style and a list of unbuilt theme names and returns
+            the names in the order they should be built; ``most_recently_used`` by default.
+        :param str build_profile: the widget families and color variants to build; *full* builds all styles,
+            *minimal* builds only the base styles without ``{color}.X`` variants. Styles that are left out can be added
+            with ``ensure_styles``.
+        :param families: the widget families to build styles for, overriding the build profile; see
+            ``StylerTTK.families``.
+        :param variants: the theme colors to build ``{color}.X`` style variants for, overriding the build profile.
+        :param int max_resident_themes: the maximum number of built themes kept in memory; the least recently used
+            themes are unloaded when more themes are built. No limit by default.
+        :param str bundle: a directory of precompiled themes written by ``python -m ttkbootstrap compile``; see
+            ``load_bundle``.
+        """
+        if build_profile not in self.build_profiles:
+            raise ValueError(f"{build_profile} is not a valid build profile. Please try one of the following: "
+                             f"{', '.join(self.build_profiles)}")
+        profile = self.build_profiles[build_profile]
+        self.families = StylerTTK.check_families(profile['families'] if families is None else families)
+        self.variants = StylerTTK.check_variants(profile['variants'] if variants is None else variants)
         super().__init__(*args, **kwargs)
-        self.themes = {}
+        # the themes are shared by all Style instances of the interpreter
+        registry = self._registry = ThemeRegistry.get(self.master)
+        self.themes = registry.themes
+        self._theme_definitions = registry.definitions
+        self._bundled_themes = registry.bundled
+        self._theme_history = registry.history
+        self._pending_builds = registry.pending
+        self._prebuild_id = None
+        self.prebuild = prebuild
+        self.prebuild_budget = prebuild_budget
+        self.prebuild_priority = prebuild_priority or most_recently_used
+        self.max_resident_themes = max_resident_themes
+        if isinstance(cache, ThemeCache):
+            self._theme_cache = cache
+        else:
+            self._theme_cache = ThemeCache() if cache else None
         self._load_themes()
+        if bundle:
+            self.load_bundle(bundle)
         self.theme_use(themename=theme)
+        if self.prebuild:
+            self._schedule_prebuild()
 
     @property
     def colors(self):
-        theme = self.theme_use()
+        """
+        The colors of the current theme. The current theme is known without asking Tcl as long as themes are changed
+        with ``Style.theme_use``.
+        """
+        theme = self._registry.current or self.theme_use()
         if theme in self.themes:
             return self.themes.get(theme).theme.colors
         else:
             return Colors()
 
-    def _load_themes(self):
+    def configure(self, style, query_opt=None, **kw):
+        """
+        Query or set the default value of the specified option(s) in style. Queries of options set by the theme are
+        answered from the theme settings without asking Tcl.
+        """
+        if query_opt is not None and not kw:
+            value = self._mirrored_value(style, query_opt.lstrip('-'), 'configure')
+            if value is not None:
+                return value
+        elif kw:
+            self._registry.record_override(style, kw)
+        return super().configure(style, query_opt, **kw)
+
+    def map(self, style, query_opt=None, **kw):
+        """
+        Query or set dynamic values of the specified option(s) in style.
+        """
+        if kw:
+            self._registry.record_override(style, kw)
+        return super().map(style, query_opt, **kw)
+
+    def theme_settings(self, themename, settings):
+        """
+        Temporarily sets the current theme to themename, apply specified settings and then restore the previous
+        theme.
+        """
+        for style, spec in settings.items():
+            self._registry.record_override(style, [*spec.get('configure', ()), *spec.get('map', ())], themename)
+        super().theme_settings(themename, settings)
+
+    def lookup(self, style, option, state=None, default=None):
+        """
+        Returns the value specified for option in style. Lookups without a state of options set by the theme are
+        answered from the theme settings without asking Tcl.
+        """
+        if not state:
+            value = self._mirrored_value(style, option.lstrip('-'), 'lookup')
+            if value is not None:
+                return value
+        return super().lookup(style, option, state, default)
+
+    def _mirrored_value(self, style, option, query):
+        """
+        Resolve an option of the current theme from its settings the way ttk does: the maps of the style and its
+        parent styles are searched for a state specification that matches the normal state, then their defaults.
+
+        Only string values are answered, which Tcl returns as strings too; numbers and lists are left to Tcl. Options
+        that were changed after the theme was built with ``configure``, ``map`` or ``theme_settings`` of this class
+        are looked up in Tcl. The mirror only sees changes made through ``ttkbootstrap.Style``: styles and themes
+        changed with a plain ``ttk.Style`` or with Tcl commands are not seen, so set ``mirror_queries`` to False when
+        the application does that.
+
+        :param str style: the style name
+        :param str option: the option name without the leading dash
+        :param str query: *configure* for the value set on the style itself, *lookup* to include parent styles
+
+        :returns: the value as a string, or None if it cannot be resolved without Tcl
+        """
+        registry = self._registry
+        styler = self.themes.get(registry.current)
+        if not self.mirror_queries or styler is None or not styler.settings:
+            return None
+        settings = styler.settings
+        names = [style]
+        if query == 'lookup':
+            parts = style.split('.')
+            names = ['.'.join(parts[i:]) for i in range(len(parts))] + ['.']
+        if any((name, option) in registry.overrides.get(registry.current, ()) for name in names):
+            return None
+        if query == 'lookup':
+            for name in names:
+                for spec in settings.get(name, {}).get('map', {}).get(option, ()):
+                    # the normal state matches a state specification that only has negated states
+                    if all(state.startswith('!') for state in ' '.join(spec[:-1]).split()):
+                        return self._mirror_string(spec[-1])
+            parent_maps = registry.parent_maps(self)
+            if option in parent_maps:
+                return parent_maps[option]
+        for name in names:
+            value = settings.get(name, {}).get('configure', {}).get(option)
+            if value is not None:
+                return self._mirror_string(value)
+        return None
+
+    @staticmethod
+    def _mirror_string(value):
         """
-        Load all ttkbootstrap defined themes
+        A string setting value; Tcl may return other values as numbers, tuples or ``Tcl_Obj`` instances, so they are
+        left to Tcl.
         """
-        # pre-defined themes
-        json_data = importlib.resources.read_text('ttkbootstrap', 'themes.json')
-        builtin_themes = json.loads(json_data)
+        return value if isinstance(value, str) else None
 
-        # user defined themes
-        user_path = Path(builtin_themes['userpath'])
-        if user_path.exists():
-            with user_path.open(encoding='utf-8') as f:
-                user_themes = json.load(f)
-        else:
-            user_themes = {'themes': []}
-
-        # combined theme collection
-        settings = {'themes': builtin_themes['themes'] + user_themes['themes']}
-
-        for theme in settings['themes']:
-            if theme['name'] not in self.theme_names():
-                settings = ThemeDefinition(
+    def _load_themes(self):
+        """
+        Register all ttkbootstrap defined themes that are not registered yet. Only the theme definitions are parsed
+        here; the ttk theme itself is built the first time it is requested by ``theme_use``.
+        """
+        existing_themes = super().theme_names()
+        for theme in read_theme_settings():
+            if theme['name'] not in existing_themes and theme['name'] not in self._theme_definitions:
+                definition = ThemeDefinition(
                     name=theme['name'],
                     themetype=theme['type'],
                     font=theme['font'],
                     colors=Colors(**theme['colors']))
-                self.themes[settings.name] = StylerTTK(self, settings)
+                self._theme_definitions[definition.name] = definition
+
+    def _build_theme(self, themename):
+        """
+        Create the ttk theme for a registered theme definition. A theme that is partly built in the background is
+        finished immediately.
+
+        :param str themename: the name of a registered theme definition
+
+        :returns: the styler that created the theme
+        :rtype: StylerTTK
+        """
+        styler, steps = self._pending_builds.pop(themename, (None, None))
+        if styler is None:
+            styler, steps = self._start_build(themename)
+        for _ in steps:
+            pass
+        self.themes[themename] = styler
+        return styler
+
+    def _start_build(self, themename):
+        """
+        Create the styler for a registered theme definition without building the theme.
+
+        :returns: the styler and the generator that builds the theme one step at a time
+        :rtype: tuple[StylerTTK, generator]
+        """
+        if themename in self._bundled_themes:
+            path, manifest, entry = self._bundled_themes[themename]
+            styler = StylerTTK(self, self._theme_definitions[themename], build=False,
+                               families=manifest['families'], variants=manifest['variants'])
+            return styler, styler.bundle_steps(path, entry, self.families, self.variants)
+        styler = StylerTTK(self, self._theme_definitions[themename], cache=self._theme_cache, build=False,
+                           families=self.families, variants=self.variants)
+        return styler, styler.build_steps()
+
+    def load_bundle(self, path):
+        """
+        Register the themes of a bundle of precompiled themes written by ``python -m ttkbootstrap compile``. A
+        bundled theme is created by sourcing its Tcl script instead of being built in Python. Themes that have
+        already been built are not replaced.
+
+        :param str path: the bundle directory
+
+        :raises ValueError: if the bundle was compiled on a platform with different native elements
+        """
+        import json
+        path = Path(path)
+        manifest = json.loads((path / 'manifest.json').read_text(encoding='utf-8'))
+        if manifest['xpnative'] != ('xpnative' in super().theme_names()):
+            raise ValueError(f"{path} was compiled for a platform with different native theme elements")
+        for theme in manifest['themes']:
+            if theme['name'] in self.themes:
+                continue
+            styler, _ = self._pending_builds.pop(theme['name'], (None, None))
+            if styler:
+                styler.release_images()
+            self._theme_definitions[theme['name']] = ThemeDefinition(
+                name=theme['name'],
+                themetype=theme['type'],
+                font=theme['font'],
+                colors=Colors(**theme['colors']))
+            self._bundled_themes[theme['name']] = (path, manifest, theme)
+
+    def ensure_styles(self, *stylenames, families=(), variants=()):
+        """
+        Build styles that were left out by the build profile, in every theme that has been built and in themes that
+        are built later. Call this before widgets use the styles; ttk silently falls back to the base style for a
+        ``{color}.X`` style that does not exist.
+
+        Example::
+
+            style.ensure_styles('danger.TButton', 'info.Treeview.Heading')
+
+        :param str stylenames: the style names that are needed
+        :param families: widget families to build
+        :param variants: color variants to build
+
+        :raises ValueError: if a style is not a ttkbootstrap style
+        """
+        families, variants = set(families), set(variants)
+        for stylename in stylenames:
+            family, variant = StylerTTK.style_family(stylename)
+            if family is None:
+                raise ValueError(f"{stylename} is not a ttkbootstrap style")
+            families.add(family)
+            if variant:
+                variants.add(variant)
+        self.families = StylerTTK.check_families(families | set(self.families))
+        self.variants = StylerTTK.check_variants(variants | set(self.variants))
+        for styler in self.themes.values():
+            styler.extend(self.families, self.variants)
+        # restart partly built themes with the new selection
+        for styler, _ in self._pending_builds.values():
+            styler.release_images()
+        self._pending_builds.clear()
+
+    def _schedule_prebuild(self):
+        """
+        Build the next slice of unbuilt themes when the application is idle.
+        """
+        if self._prebuild_id is None:
+            try:
+                self._prebuild_id = self.master.after_idle(self._prebuild_slice)
+            except tkinter.TclError:
+                # the application has been destroyed
+                pass
+
+    def _prebuild_slice(self):
+        """
+        Advance the background build of unbuilt themes one step at a time until the time budget is used up.
+        """
+        self._prebuild_id = None
+        if self.max_resident_themes is not None and len(self.themes) >= self.max_resident_themes:
+            # building more themes would only unload the themes that are in use
+            return
+        deadline = time.perf_counter() + self.prebuild_budget / 1000
+        while time.perf_counter() < deadline:
+            unbuilt = [name for name in self._theme_definitions if name not in self.themes]
+            if not unbuilt:
+                return
+            themename = self.prebuild_priority(self, unbuilt)[0]
+            if themename not in self._pending_builds:
+                self._pending_builds[themename] = self._start_build(themename)
+            styler, steps = self._pending_builds[themename]
+            try:
+                next(steps)
+            except StopIteration:
+                del self._pending_builds[themename]
+                self.themes[themename] = styler
+            except Exception:
+                # stop building in the background; the error is raised again if the theme is used
+                del self._pending_builds[themename]
+                raise
+        self._schedule_prebuild()
+
+    def unload_theme(self, themename):
+        """
+        Release the styler, settings, and images of a built theme. The theme definition is kept, so the theme is
+        built again the next time it is used.
+
+        Tk 8.6 cannot delete a ttk theme, so the Tcl theme and its elements remain and are reused when the theme is
+        rebuilt; the images they refer to are deleted when no other theme uses them.
+
+        :param str themename: the name of a ttkbootstrap theme
+
+        :raises ValueError: if the theme is not a ttkbootstrap theme or is the theme in use
+        """
+        if themename not in self._theme_definitions:
+            raise ValueError(f"{themename} is not a valid theme name. Please try one of the following: "
+                             f"{', '.join(self._theme_definitions)}")
+        if themename == super().theme_use():
+            raise ValueError(f"{themename} is the theme in use and cannot be unloaded")
+        styler, _ = self._pending_builds.pop(themename, (None, None))
+        styler = self.themes.pop(themename, styler)
+        if styler is None:
+            return
+        styler.release_images()
+        try:
+            # not supported by Tk 8.6; the theme name is reused instead
+            self.tk.call('ttk::style', 'theme', 'delete', themename)
+        except tkinter.TclError:
+            pass
+
+    def _evict_themes(self):
+        """
+        Unload the least recently used themes until no more than ``max_resident_themes`` themes are built. The theme
+        in use is never unloaded.
+        """
+        if self.max_resident_themes is None:
+            return
+        current = super().theme_use()
+        resident = [name for name in self._theme_history if name in self.themes]
+        resident.extend(name for name in self.themes if name not in resident)
+        for themename in reversed(resident):
+            if len(self.themes) <= self.max_resident_themes:
+                break
+            if themename != current:
+                self.unload_theme(themename)
+
+    def theme_names(self):
+        """
+        Returns a list of all known themes, including ttkbootstrap themes that have not been built yet.
+
+        :rtype: tuple[str]
+        """
+        names = list(super().theme_names())
+        names.extend(name for name in self._theme_definitions if name not in names)
+        return tuple(names)
 
     def theme_use(self, themename=None):
         """
@@ -91,6 +419,8 @@ class Style(ttk.Style):
         Only use this method if you are changing the theme *during* runtime. Otherwise, pass the theme name into the
         Style constructor to instantiate the style with a theme.
 
+        ttkbootstrap themes are built on demand the first time they are used.
+
         :param str themename: the theme to apply when creating new widgets
         """
         if not themename:
@@ -101,9 +431,18 @@ class Style(ttk.Style):
             print(self.theme_names())
             return
 
+        if themename in self._theme_definitions and themename not in self.themes:
+            self._build_theme(themename)
+
+        if themename in self._theme_history:
+            self._theme_history.remove(themename)
+        self._theme_history.insert(0, themename)
+
         if themename in self.themes:
             try:
                 super().theme_use(themename)
+                self._registry.current = themename
+                self._evict_themes()
                 current = self.themes.get(themename)
                 if current:
                     current.styler_tk.style_tkinter_widgets()
@@ -112,6 +451,179 @@ class Style(ttk.Style):
                 return
         else:
             super().theme_use(themename)
+            self._registry.current = themename
+
+
+def _watch_interpreter(master):
+    """
+    Forget the state that ``ThemeRegistry``, ``ImageCache`` and ``StylerTK`` keep for a Tcl interpreter when its root
+    window is destroyed, so that the interpreter, its images and its widgets can be freed. An interpreter without Tk
+    has no root window, and its state is kept.
+
+    :param master: a widget of the interpreter
+    """
+    interp = master.tk
+    if interp in _watched_interps:
+        return
+    try:
+        master._root().bind('<Destroy>', _forget_interpreter, '+')
+    except tkinter.TclError:
+        return
+    _watched_interps.add(interp)
+
+
+def _forget_interpreter(event):
+    """
+    The ``<Destroy>`` binding of a root window; the bindings of the root window also receive the events of its children
+    """
+    if str(event.widget) != '.':
+        return
+    interp = event.widget.tk
+    _watched_interps.discard(interp)
+    for interps in (ThemeRegistry._interps, ImageCache._interps, StylerTK._active_options):
+        interps.pop(interp, None)
+
+
+# the interpreters whose root window is watched by ``_watch_interpreter``
+_watched_interps = set()
+
+
+def most_recently_used(style, themenames):
+    """
+    A ``Style.prebuild_priority`` function: themes that were used most recently are built first, followed by the
+    remaining themes in the order they were defined.
+
+    :param Style style: the style that builds the themes
+    :param list themenames: the names of the themes that are not built yet
+
+    :returns: the theme names in build order
+    :rtype: list
+    """
+    recent = [name for name in style._theme_history if name in themenames]
+    return recent + [name for name in themenames if name not in recent]
+
+
+def definition_order(style, themenames):
+    """
+    A ``Style.prebuild_priority`` function: themes are built in the order they were defined.
+    """
+    return list(themenames)
+
+
+def read_theme_settings():
+    """
+    The settings of the pre-defined themes followed by the user defined themes. The theme files are parsed once per
+    process; the user themes file is parsed again when it changes.
+
+    :rtype: list[dict]
+    """
+    builtin_themes = _read_builtin_themes()
+    user_path = Path(builtin_themes['userpath'])
+    try:
+        modified = user_path.stat().st_mtime_ns
+    except OSError:
+        return builtin_themes['themes']
+    return builtin_themes['themes'] + _read_user_themes(str(user_path), modified)
+
+
+@lru_cache(maxsize=None)
+def _read_builtin_themes():
+    import json
+    import importlib.resources
+    json_data = importlib.resources.read_text('ttkbootstrap', 'themes.json')
+    return json.loads(json_data)
+
+
+@lru_cache(maxsize=4)
+def _read_user_themes(path, modified):
+    import json
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['themes']
+
+
+class ThemeRegistry:
+    """
+    The ttkbootstrap themes of a Tcl interpreter: the registered theme definitions and the built themes. The registry
+    is shared by all ``Style`` instances of the interpreter, so a theme is built once and every instance can use it.
+    The registry is discarded when the root window of the interpreter is destroyed.
+    """
+    _interps = {}
+
+    def __init__(self):
+        self.definitions = {}
+        self.bundled = {}
+        self.themes = {}
+        self.history = []
+        self.pending = {}
+        self.current = None
+        self.overrides = {}
+        self._parent_maps = None
+
+    @classmethod
+    def get(cls, master):
+        """
+        Get the registry of an interpreter, creating it if it does not exist yet.
+
+        :param master: a widget of the interpreter
+
+        :rtype: ThemeRegistry
+        """
+        interp = master.tk
+        registry = cls._interps.get(interp)
+        if registry is None:
+            registry = cls._interps[interp] = cls()
+            _watch_interpreter(master)
+        return registry
+
+    def record_override(self, style, options, themename=None):
+        """
+        Record options that were changed in a theme after it was built; their values are looked up in Tcl.
+
+        :param str style: the style name
+        :param options: the option names
+        :param str themename: the theme; the current theme by default
+        """
+        themename = themename or self.current
+        if themename is not None:
+            self.overrides.setdefault(themename, set()).update((style, option.lstrip('-')) for option in options)
+
+    def record_settings(self, themename, settings=None):
+        """
+        Record that ttkbootstrap applied generated settings to a theme, so that the options they set are answered from
+        the settings again.
+
+        :param str themename: the theme
+        :param dict settings: the applied settings; all settings of the theme by default
+        """
+        if settings is None:
+            self.overrides.pop(themename, None)
+        elif themename in self.overrides:
+            self.overrides[themename].difference_update(
+                (style, option.lstrip('-')) for style, spec in settings.items()
+                for option in [*spec.get('configure', ()), *spec.get('map', ())])
+
+    def parent_maps(self, style):
+        """
+        The dynamic values of the root style of the ``clam`` theme, which ttkbootstrap themes are built on, that match
+        the normal state; a matching state specification in the parent theme takes precedence over a default set by
+        the theme.
+
+        :param Style style: a style of the interpreter
+
+        :returns: the value of each option
+        :rtype: dict
+        """
+        if self._parent_maps is None:
+            self._parent_maps = {}
+            splitlist = style.tk.splitlist
+            result = splitlist(style.tk.call('ttk::style', 'theme', 'settings', 'clam', 'ttk::style map .'))
+            for option, statemap in zip(result[::2], result[1::2]):
+                statemap = splitlist(statemap)
+                for spec, value in zip(statemap[::2], statemap[1::2]):
+                    if all(str(state).startswith('!') for state in splitlist(spec)):
+                        self._parent_maps[str(option).lstrip('-')] = str(value)
+                        break
+        return self._parent_maps
 
 
 class ThemeDefinition:
@@ -219,17 +731,8 @@ class Colors:
         :returns: rgb color value
         :rtype: tuple
         """
-        if len(color) == 4:
-            # 3 digit hexadecimal colors
-            r = round(int(color[1], 16) / 255, 2)
-            g = round(int(color[2], 16) / 255, 2)
-            b = round(int(color[3], 16) / 255, 2)
-        else:
-            # 6 digit hexadecimal colors
-            r = round(int(color[1:3], 16) / 255, 2)
-            g = round(int(color[3:5], 16) / 255, 2)
-            b = round(int(color[5:], 16) / 255, 2)
-        return r, g, b
+        r, g, b = _hex_to_int_rgb(color)
+        return r / 255, g / 255, b / 255
 
     @staticmethod
     def rgb_to_hex(r, g, b):
@@ -243,10 +746,7 @@ class Colors:
         :returns: a hexadecimal color value
         :rtype: str
         """
-        r_ = int(r * 255)
-        g_ = int(g * 255)
-        b_ = int(b * 255)
-        return '#{:02x}{:02x}{:02x}'.format(r_, g_, b_)
+        return '#{:02x}{:02x}{:02x}'.format(round(r * 255), round(g * 255), round(b * 255))
 
     @staticmethod
     def brightness(hex_color, pct_change):
@@ -267,58 +767,690 @@ class Colors:
         :returns: a lightened or darkened hexadecimal color value
         :rtype: str
         """
-        r, g, b = Colors.hex_to_rgb(hex_color)
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        v_ = (1 + pct_change) * v
-        v_max = max(0, v_)
-        v_min = min(1, v_max)
-        r_, g_, b_ = colorsys.hsv_to_rgb(h, s, v_min)
-        return Colors.rgb_to_hex(r_, g_, b_)
+        return _brightness(hex_color, pct_change)
+
+    def derive(self, pct_changes=(-0.2, -0.1, -0.05)):
+        """
+        Adjust the brightness of every color in the palette by each of the percent changes in one call.
+
+        :param tuple pct_changes: the brightness changes to apply; these are the changes used to build a theme by
+            default.
+
+        :returns: the adjusted colors by color label and percent change, e.g. ``shades['primary'][-0.2]``
+        :rtype: dict
+        """
+        return {label: {pct: _brightness(self.__dict__[label], pct) for pct in pct_changes}
+                for label in self.label_iter()}
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_int_rgb(color):
+    """
+    Convert a hexadecimal color to an integer rgb color value; ``#rgb`` is expanded to ``#rrggbb``.
+    """
+    if len(color) == 4:
+        color = '#' + ''.join(c * 2 for c in color[1:])
+    value = int(color[1:], 16)
+    return value >> 16, (value >> 8) & 0xff, value & 0xff
+
+
+@lru_cache(maxsize=4096)
+def _brightness(hex_color, pct_change):
+    """
+    Integer implementation of ``Colors.brightness``. Changing the value of a color in the HSV color space while keeping
+    the hue and saturation is the same as scaling each rgb channel by the ratio of the new and the old value.
+    """
+    r, g, b = _hex_to_int_rgb(hex_color)
+    v = max(r, g, b)
+    if v == 0:
+        return '#000000'
+    v_ = min(255.0, max(0.0, (1 + pct_change) * v))
+    return '#%02x%02x%02x' % (int(r * v_ / v + 0.5), int(g * v_ / v + 0.5), int(b * v_ / v + 0.5))
+
+
+class ImageCache:
+    """
+    A process-wide cache of the images used by theme elements. Each unique image, keyed by shape, color, size and
+    scale, is created once per Tcl interpreter and shared by every theme that uses it. The images are reference
+    counted, so releasing the images of a theme deletes the images no other theme is using.
+
+    Images are named after their key, so theme settings can refer to an image by name across runs. The images of an
+    interpreter are forgotten when its root window is destroyed.
+    """
+    _interps = {}
+
+    @staticmethod
+    def image_name(shape, color, size, scale=1):
+        """
+        The Tcl image name for an image key
+
+        :param str shape: the shape of the image: *circle* or *square*
+        :param str color: the fill color of the image
+        :param int size: the width and height of the image
+        :param scale: a multiplier applied to the size of the image
+
+        :rtype: str
+        """
+        return re.sub(r'\W', '_', f'ttkbootstrap_{shape}_{color}_{size}_{scale}')
+
+    @classmethod
+    def acquire(cls, master, shape, color, size, scale=1, data=None):
+        """
+        Get a shared image, creating it if it does not exist yet, and increase its reference count.
+
+        :param master: a widget of the interpreter the image is used in
+        :param str shape: the shape of the image: *circle* or *square*
+        :param str color: the fill color of the image
+        :param int size: the width and height of the image
+        :param scale: a multiplier applied to the size of the image
+        :param str data: base64 encoded png data to create the image from instead of drawing it
+
+        :returns: the shared image
+        :rtype: PhotoImage
+        """
+        interp = master.tk
+        if interp not in cls._interps:
+            _watch_interpreter(master)
+        images = cls._interps.setdefault(interp, {})
+        name = cls.image_name(shape, color, size, scale)
+        entry = images.get(name)
+        if entry is None:
+            if data is not None:
+                with BuildProfiler.measure(None, 'load_image'):
+                    image = tkinter.PhotoImage(name=name, master=master, data=data, format='png')
+            else:
+                with BuildProfiler.measure(None, f'render_{shape}'):
+                    image = cls._render(master, name, shape, color, round(size * scale))
+            entry = images[name] = [image, 0]
+        entry[1] += 1
+        return entry[0]
+
+    @classmethod
+    def release(cls, master, image):
+        """
+        Decrease the reference count of a shared image. The image is deleted when it is no longer used.
+
+        :param master: a widget of the interpreter the image is used in
+        :param image: an image returned by ``acquire``
+        """
+        interp = master.tk
+        images = cls._interps.get(interp, {})
+        entry = images.get(str(image))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del images[str(image)]
+            if not images:
+                del cls._interps[interp]
+
+    @classmethod
+    def count(cls, master=None):
+        """
+        The number of shared images held by the cache
+
+        :param master: count only the images of this widget's interpreter
+
+        :rtype: int
+        """
+        if master is not None:
+            return len(cls._interps.get(master.tk, {}))
+        return sum(len(images) for images in cls._interps.values())
+
+    @staticmethod
+    def _render(master, name, shape, color, size):
+        """
+        Draw an image of the given shape
+
+        :returns: the image
+        :rtype: PhotoImage
+        """
+        if shape == 'circle':
+            # Pillow is only imported when an image is drawn; cached and bundled themes load their images as png data
+            from PIL import ImageTk, Image, ImageDraw
+            # the circle is drawn large and scaled down to get smooth edges
+            im = Image.new('RGBA', (100, 100))
+            draw = ImageDraw.Draw(im)
+            draw.ellipse((0, 0, 95, 95), fill=color)
+            return ImageTk.PhotoImage(im.resize((size, size), Image.LANCZOS), name=name, master=master)
+        elif shape == 'square':
+            image = tkinter.PhotoImage(name=name, master=master, width=size, height=size)
+            image.put(color, to=(0, 0, size, size))
+            return image
+        raise ValueError(f'{shape} is not a valid image shape')
+
+
+class BuildProfiler:
+    """
+    Records the wall time and the change in the number of allocated memory blocks of each step of building and
+    applying themes: the `_style_widget` methods, the creation of the ttk theme, image rendering, and the styling of
+    the tkinter widgets. Steps are recorded while the profiler is active::
+
+        with BuildProfiler() as profiler:
+            style = Style()
+            style.theme_use('darkly')
+        print(profiler.format_report())
+
+    Steps can be nested; image rendering, for example, is recorded within the `_style_widget` method that requested
+    the image. Theme totals only add up the outermost steps.
+    """
+    active = None
+
+    def __init__(self):
+        self.records = []
+        self._stack = []
+
+    def __enter__(self):
+        BuildProfiler.active = self
+        return self
+
+    def __exit__(self, *exc):
+        BuildProfiler.active = None
+
+    @classmethod
+    @contextmanager
+    def measure(cls, themename, step):
+        """
+        Record a step when a profiler is active
+
+        :param str themename: the theme the step belongs to; the theme of the enclosing step if None
+        :param str step: the name of the step
+        """
+        profiler = cls.active
+        if profiler is None:
+            yield
+            return
+        if themename is None and profiler._stack:
+            themename = profiler._stack[-1]
+        profiler._stack.append(themename)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            profiler._stack.pop()
+            profiler.records.append({
+                'theme': themename,
+                'step': step,
+                'depth': len(profiler._stack),
+                'seconds': seconds,
+                'blocks': sys.getallocatedblocks() - blocks})
+
+    def report(self):
+        """
+        The recorded steps, summed by theme and step, and by step across all themes
+
+        :returns: the total seconds of the outermost steps, and the calls, seconds and blocks of each step
+        :rtype: dict
+        """
+        report = {'total': 0.0, 'themes': {}, 'steps': {}}
+        for record in self.records:
+            theme = report['themes'].setdefault(record['theme'], {'total': 0.0, 'steps': {}})
+            if record['depth'] == 0:
+                report['total'] += record['seconds']
+                theme['total'] += record['seconds']
+            for steps in (theme['steps'], report['steps']):
+                step = steps.setdefault(record['step'], {'calls': 0, 'seconds': 0.0, 'blocks': 0})
+                step['calls'] += 1
+                step['seconds'] += record['seconds']
+                step['blocks'] += record['blocks']
+        return report
+
+    def format_report(self):
+        """
+        The report as a table of the steps, slowest first, followed by the total of each theme
+
+        :rtype: str
+        """
+        report = self.report()
+        lines = [f"{'step':<32}{'calls':>8}{'ms':>12}{'blocks':>12}"]
+        for name, step in sorted(report['steps'].items(), key=lambda item: -item[1]['seconds']):
+            lines.append(f"{name:<32}{step['calls']:>8}{step['seconds'] * 1000:>12.2f}{step['blocks']:>12}")
+        lines.append('')
+        lines.append(f"{'theme':<32}{'':>8}{'ms':>12}")
+        for name, theme in sorted(report['themes'].items(), key=lambda item: -item[1]['total']):
+            lines.append(f"{str(name):<32}{'':>8}{theme['total'] * 1000:>12.2f}")
+        lines.append(f"{'total':<32}{'':>8}{report['total'] * 1000:>12.2f}")
+        return '\n'.join(lines)
+
+
+class TclTracer:
+    """
+    Counts and times the Tcl commands that Python issues to an interpreter while the tracer is active. Commands are
+    aggregated by name; widget commands are counted as ``<widget>`` and the subcommand is included when there is
+    one, e.g. ``ttk::style configure`` or ``option add``::
+
+        with TclTracer() as tracer:
+            style.theme_use('darkly')
+        assert tracer.total < 50
+        print(tracer.format_report())
+
+    This is a tool for tests and benchmarks, not for application code. While active, the interpreter held by every
+    tkinter object (widgets, styles, images, variables) is replaced by a proxy that records the calls, and the
+    original interpreter is restored on exit. Finding these objects scans the whole Python heap, so entering and
+    leaving the tracer take time proportional to the number of live objects. The proxy compares and hashes equal to
+    the interpreter, so lookups keyed by ``widget.tk`` are not affected. Tracers cannot be nested.
+
+    :param master: a widget of the interpreter to trace; the default root window by default
+    """
+
+    def __init__(self, master=None):
+        self.master = master
+        self.commands = {}
+        self._proxy = None
+
+    def __enter__(self):
+        master = self.master or tkinter._default_root
+        if master is None:
+            raise RuntimeError('there is no Tcl interpreter to trace; create a Tk window first')
+        if isinstance(master.tk, _TracedInterpreter):
+            raise RuntimeError('the interpreter is already traced')
+        self._proxy = _TracedInterpreter(master.tk, self)
+        self._replace(self._proxy._tkapp, self._proxy)
+        return self
+
+    def __exit__(self, *exc):
+        self._replace(self._proxy, self._proxy._tkapp)
+
+    @staticmethod
+    def _replace(old, new):
+        """
+        Replace the interpreter held by every tkinter object. The objects are collected before any is changed, so
+        the interpreter is replaced in all of them or in none.
+        """
+        holders = []
+        for referrer in gc.get_referrers(old):
+            # the attributes of an object are not always stored in a separate dictionary
+            attributes = referrer if isinstance(referrer, dict) else getattr(referrer, '__dict__', None)
+            if isinstance(attributes, dict):
+                holders.extend(
+                    (attributes, attribute) for attribute in ('tk', '_tk') if attributes.get(attribute) is old)
+        for attributes, attribute in holders:
+            attributes[attribute] = new
+
+    def record(self, name, seconds):
+        command = self.commands.setdefault(name, {'calls': 0, 'seconds': 0.0})
+        command['calls'] += 1
+        command['seconds'] += seconds
+
+    @property
+    def total(self):
+        """
+        The number of commands issued
+
+        :rtype: int
+        """
+        return sum(command['calls'] for command in self.commands.values())
+
+    def report(self):
+        """
+        The recorded commands
+
+        :returns: the total number of calls and seconds, and the calls and seconds of each command
+        :rtype: dict
+        """
+        return {
+            'calls': self.total,
+            'seconds': sum(command['seconds'] for command in self.commands.values()),
+            'commands': {name: dict(command) for name, command in self.commands.items()}}
+
+    def format_report(self):
+        """
+        The report as a table of the commands, most frequent first
+
+        :rtype: str
+        """
+        report = self.report()
+        lines = [f"{'command':<40}{'calls':>8}{'ms':>12}"]
+        for name, command in sorted(report['commands'].items(), key=lambda item: -item[1]['calls']):
+            lines.append(f"{name:<40}{command['calls']:>8}{command['seconds'] * 1000:>12.2f}")
+        lines.append(f"{'total':<40}{report['calls']:>8}{report['seconds'] * 1000:>12.2f}")
+        return '\n'.join(lines)
+
+
+# commands whose second word is not a subcommand
+_NON_ENSEMBLE_COMMANDS = {'set', 'unset', 'incr', 'append', 'lappend', 'source', 'destroy', 'rename'}
+
+
+class _TracedInterpreter:
+    """
+    A proxy of a Tcl interpreter that reports the commands it evaluates to a ``TclTracer``
+    """
+    _traced = ('call', 'eval', 'getvar', 'setvar', 'globalgetvar', 'globalsetvar', 'unsetvar', 'globalunsetvar',
+               'createcommand', 'deletecommand')
+
+    def __init__(self, tkapp, tracer):
+        self._tkapp = tkapp
+        self._tracer = tracer
+
+    def __eq__(self, other):
+        if isinstance(other, _TracedInterpreter):
+            other = other._tkapp
+        return self._tkapp is other
+
+    def __hash__(self):
+        return hash(self._tkapp)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._tkapp, name)
+        if name not in self._traced:
+            return attribute
+
+        def traced(*args):
+            start = time.perf_counter()
+            try:
+                return attribute(*args)
+            finally:
+                self._tracer.record(self._command_name(name, args), time.perf_counter() - start)
+        return traced
+
+    @staticmethod
+    def _command_name(method, args):
+        if method != 'call':
+            return method
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        if not args:
+            return ''
+        name = str(args[0])
+        if name.startswith('.'):
+            name = '<widget>'
+        if len(args) > 1 and isinstance(args[1], str) and args[1].isalpha() and name not in _NON_ENSEMBLE_COMMANDS:
+            name = f'{name} {args[1]}'
+        return name
+
+
+class ThemeCache:
+    """
+    A persistent cache of compiled theme settings and images, stored in the user cache directory.
+
+    Entries are keyed by a hash of the theme definition, the ttkbootstrap version and the code that generates the
+    settings, so a cached theme is invalidated as soon as its definition in ``themes.json`` or the user themes file, or
+    the styling code, changes. The cache location can be overridden with the ``TTKBOOTSTRAP_CACHE_DIR`` environment
+    variable.
+
+    :param str path: the cache directory; the user cache directory is used by default.
+    """
+    format = 4
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else self.default_path()
+
+    def __repr__(self):
+        return f'ThemeCache(path={str(self.path)!r})'
+
+    @staticmethod
+    def default_path():
+        """
+        The platform specific user cache directory for ttkbootstrap
+
+        :rtype: Path
+        """
+        env_path = os.environ.get('TTKBOOTSTRAP_CACHE_DIR')
+        if env_path:
+            return Path(env_path)
+        if sys.platform == 'win32':
+            base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+        elif sys.platform == 'darwin':
+            base = Path.home() / 'Library' / 'Caches'
+        else:
+            base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+        return base / 'ttkbootstrap'
+
+    @staticmethod
+    def key(definition, **extra):
+        """
+        Create a cache key for a theme definition
+
+        :param ThemeDefinition definition: the theme definition
+        :param extra: any other values that change the compiled settings (platform elements, etc...)
+
+        :returns: a hexadecimal digest
+        :rtype: str
+        """
+        data = {
+            'version': __version__,
+            'format': ThemeCache.format,
+            'code': ThemeCache.code_fingerprint(),
+            'name': definition.name,
+            'type': definition.type,
+            'font': definition.font,
+            'colors': {label: definition.colors.get(label) for label in Colors.label_iter()},
+            'extra': extra}
+        import json
+        import hashlib
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def code_fingerprint():
+        """
+        A digest of the code and the class attributes that generate theme settings and images: ``Colors``,
+        ``StylerTTK``, the color helpers and the image renderer.
+
+        :rtype: str
+        """
+        import json
+        import hashlib
+        digest = hashlib.sha1()
+        functions = [_hex_to_int_rgb, _brightness, ImageCache._render]
+        for cls in (Colors, StylerTTK):
+            for name, value in sorted(vars(cls).items()):
+                value = getattr(value, '__func__', getattr(value, 'fget', value))
+                if hasattr(value, '__code__') or hasattr(value, '__wrapped__'):
+                    functions.append(value)
+                elif not name.startswith('__'):
+                    try:
+                        digest.update(json.dumps([name, value], sort_keys=True, default=sorted).encode('utf-8'))
+                    except TypeError:
+                        continue
+        for func in functions:
+            while hasattr(func, '__wrapped__'):
+                func = func.__wrapped__
+            digest.update(json.dumps(ThemeCache._code_data(func.__code__)).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _code_data(value):
+        """
+        The instructions, names and constants of a code object in a form that can be hashed. ``marshal`` is not used
+        because its output depends on the reference counts of the objects.
+        """
+        from types import CodeType
+        if isinstance(value, CodeType):
+            return [value.co_code.hex(), value.co_names, value.co_varnames, value.co_freevars, value.co_cellvars,
+                    [ThemeCache._code_data(const) for const in value.co_consts]]
+        if isinstance(value, tuple):
+            return [ThemeCache._code_data(item) for item in value]
+        if isinstance(value, frozenset):
+            return sorted(repr(item) for item in value)
+        return repr(value)
+
+    def _entry_path(self, themename, key):
+        return self.path / f'{self._safe_name(themename)}-{key}.json'
+
+    @staticmethod
+    def _safe_name(themename):
+        return re.sub(r'[^\w-]', '_', themename)
+
+    def load(self, themename, key):
+        """
+        Load a cache entry
+
+        :param str themename: the name of the theme
+        :param str key: the cache key of the theme definition
+
+        :returns: the cached entry or ``None`` when the theme is not cached
+        :rtype: dict
+        """
+        import json
+        try:
+            with self._entry_path(themename, key).open(encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, themename, key, entry):
+        """
+        Save a cache entry and remove stale entries of the same theme. Failing to write the cache is not an error.
+
+        :param str themename: the name of the theme
+        :param str key: the cache key of the theme definition
+        :param dict entry: a json serializable cache entry
+        """
+        import json
+        path = self._entry_path(themename, key)
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            pattern = re.compile(re.escape(self._safe_name(themename)) + r'-[0-9a-f]{40}\.json')
+            for stale in self.path.glob(f'{self._safe_name(themename)}-*.json'):
+                if pattern.fullmatch(stale.name) and stale != path:
+                    stale.unlink()
+            temp = path.with_suffix(f'.{os.getpid()}.tmp')
+            with temp.open('w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(temp, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Remove all cache entries
+        """
+        for path in self.path.glob('*.json'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
 
 class StylerTK:
     """
     A class for styling tkinter widgets (not ttk).
 
+    The styles are option database entries. The entries of a theme are computed once, and switching themes writes only
+    the entries that differ from those of the theme that was applied before.
+
     :param parent: an instance of `StylerTTK`
     """
+    # the option database entries that have been applied in each Tcl interpreter, until its root window is destroyed
+    _active_options = {}
+
+    # Tcl procedures that restyle existing widgets. An option of a widget is restyled when its value is the value the
+    # option database gave it under the previous theme; options that were set explicitly keep their value.
+    retheme_script = """
+namespace eval ::ttkbootstrap {}
+
+proc ::ttkbootstrap::snapshot {names} {
+    set result {}
+    set queue [list .]
+    while {[llength $queue]} {
+        set queue [lassign $queue w]
+        lappend queue {*}[winfo children $w]
+        if {[catch {$w configure} specs]} continue
+        foreach spec $specs {
+            if {[llength $spec] != 5 || [lindex $spec 1] ni $names} continue
+            lassign $spec option dbname dbclass default value
+            if {$value ne {} && $value eq [option get $w $dbname $dbclass]} {
+                lappend result $w $option $dbname $dbclass $value
+            }
+        }
+    }
+    return $result
+}
+
+proc ::ttkbootstrap::retheme {names options} {
+    set snapshot [snapshot $names]
+    uplevel #0 $options
+    set changes {}
+    foreach {w option dbname dbclass value} $snapshot {
+        if {![winfo exists $w]} continue
+        set new [option get $w $dbname $dbclass]
+        if {$new ne {} && $new ne $value} {
+            dict lappend changes $w $option $new
+        }
+    }
+    dict for {w options} $changes {
+        catch {$w configure {*}$options}
+    }
+}
+"""
 
     def __init__(self, parent):
         self.master = parent.style.master
         self.theme = parent.theme
+        self.shades = self.theme.colors.derive()
+        self.options = None
 
     def style_tkinter_widgets(self):
         """
-        A wrapper on all widget style methods. Applies current theme to all standard tkinter widgets
-        """
-        self._style_window()
-        self._style_button()
-        self._style_label()
-        self._style_checkbutton()
-        self._style_radiobutton()
-        self._style_entry()
-        self._style_scale()
-        self._style_listbox()
-        self._style_spinbox()
-        self._style_menu()
-        self._style_menubutton()
-        self._style_labelframe()
-        self._style_scrollbar()
-        self._style_optionmenu()
-        self._style_textwidget()
-        self._style_combobox()
-
-    def _set_option(self, *args):
-        """
-        A convenience method to shorten the call to ``option_add``. *Laziness is next to godliness*.
-        """
-        self.master.option_add(*args)
+        Applies current theme to all standard tkinter widgets. The changed option database entries are written, and
+        the existing widgets are restyled with the new values, in a single Tcl evaluation.
+        """
+        with BuildProfiler.measure(self.theme.name, 'style_tkinter_widgets'):
+            interp = self.master.tk
+            if interp not in self._active_options:
+                self.master.tk.eval(self.retheme_script)
+                _watch_interpreter(self.master)
+            active = self._active_options.setdefault(interp, {})
+            # Tk resolves entries that match with the same priority by the order they were added, so an entry that
+            # follows a rewritten entry for the same option and priority is rewritten too to keep the order of the table
+            changes = {}
+            rewritten = set()
+            for pattern, entry in self.option_table().items():
+                key = (re.split(r'[.*]', pattern)[-1], entry[1])
+                if active.get(pattern) != entry or key in rewritten:
+                    changes[pattern] = entry
+                    rewritten.add(key)
+            if changes:
+                script = '\n'.join(
+                    ' '.join(tkinter._stringify(word) for word in ('option', 'add', pattern, *entry)
+                             if word is not None)
+                    for pattern, entry in changes.items())
+                self.master.tk.call('::ttkbootstrap::retheme', tuple({key[0] for key in rewritten}), script)
+                active.update(changes)
+            self.master.configure(background=self.theme.colors.bg)
+
+    def option_table(self):
+        """
+        The option database entries of the theme. A wrapper on all widget style methods.
+
+        :returns: the value and priority of each option pattern
+        :rtype: dict
+        """
+        if self.options is None:
+            self.options = {}
+            self._style_window()
+            self._style_button()
+            self._style_label()
+            self._style_checkbutton()
+            self._style_radiobutton()
+            self._style_entry()
+            self._style_scale()
+            self._style_listbox()
+            self._style_spinbox()
+            self._style_menu()
+            self._style_menubutton()
+            self._style_labelframe()
+            self._style_scrollbar()
+            self._style_optionmenu()
+            self._style_textwidget()
+            self._style_combobox()
+        return self.options
+
+    def _set_option(self, pattern, value, priority=None):
+        """
+        Add an entry to the option table of the theme; a later entry for the same pattern replaces the earlier one.
+        """
+        if isinstance(value, bool):
+            value = int(value)
+        self.options[pattern] = (value, priority)
 
     def _style_window(self):
         """
         Apply global options to all matching ``tkinter`` widgets
         """
-        self.master.configure(background=self.theme.colors.bg)
         self._set_option('*background', self.theme.colors.bg, 20)
         self._set_option('*font', self.theme.font)
         self._set_option('*borderWidth', 0, 20)
@@ -380,7 +1512,7 @@ class StylerTK:
         self._set_option('*Entry.relief', 'flat')
         self._set_option('*Entry.background',
                          (self.theme.colors.light if self.theme.type == 'light' else
-                          Colors.brightness(self.theme.colors.light, -0.1)))
+                          self.shades['light'][-0.1]))
         self._set_option('*Entry.foreground', self.theme.colors.fg)
         self._set_option('*Entry.highlightThickness', 1)
         self._set_option('*Entry.highlightBackground', self.theme.colors.border)
@@ -398,7 +1530,7 @@ class StylerTK:
         self._set_option('*Scale.highlightBackground', self.theme.colors.border)
         self._set_option('*Scale.troughColor',
                          (self.theme.colors.light if self.theme.type == 'light' else
-                          Colors.brightness(self.theme.colors.light, -0.1)))
+                          self.shades['light'][-0.1]))
 
     def _style_spinbox(self):
         """
@@ -407,7 +1539,7 @@ class StylerTK:
         self._set_option('*Spinbox.foreground', self.theme.colors.fg)
         self._set_option('*Spinbox.background',
                          (self.theme.colors.light if self.theme.type == 'light' else
-                          Colors.brightness(self.theme.colors.light, -0.1)))
+                          self.shades['light'][-0.1]))
         self._set_option('*Spinbox.highlightThickness', 1)
         self._set_option('*Spinbox.highlightColor', self.theme.colors.primary)
         self._set_option('*Spinbox.highlightBackground', self.theme.colors.border)
@@ -419,7 +1551,7 @@ class StylerTK:
         self._set_option('*Listbox.foreground', self.theme.colors.fg)
         self._set_option('*Listbox.background',
                          (self.theme.colors.light if self.theme.type == 'light' else
-                          Colors.brightness(self.theme.colors.light, -0.1)))
+                          self.shades['light'][-0.1]))
         self._set_option('*Listbox.relief', 'flat')
         self._set_option('*Listbox.activeStyle', 'none')
         self._set_option('*Listbox.highlightThickness', 1)
@@ -494,48 +1626,326 @@ class StylerTTK:
 
     :param Style style: An instance of ``ttk.Style`` class
     :param ThemeDefinition definition: creates the settings for the theme to be created
+    :param ThemeCache cache: reuse settings and images compiled by a previous run; not used by default.
+    :param dict shades: precomputed brightness variants of the theme colors in the format returned by
+        ``Colors.derive``; derived from the theme colors by default.
+    :param bool build: create the theme immediately; otherwise the theme is created by ``create_theme`` or by
+        iterating over ``build_steps``.
+    :param families: the widget families to create styles for (see ``StylerTTK.families``); all by default.
+    :param variants: the theme colors to create ``{color}.X`` style variants for; all by default.
     """
-
-    def __init__(self, style, definition):
+    # the `_style_widget` methods that create the styles of each widget family
+    families = {
+        'spinbox': ('_style_spinbox',),
+        'scale': ('_style_scale',),
+        'scrollbar': ('_style_scrollbar',),
+        'combobox': ('_style_combobox',),
+        'frame': ('_style_frame',),
+        'checkbutton': ('_style_checkbutton',),
+        'entry': ('_style_entry',),
+        'label': ('_style_label',),
+        'labelframe': ('_style_labelframe',),
+        'notebook': ('_style_notebook',),
+        'button': ('_style_outline_buttons', '_style_solid_buttons'),
+        'menubutton': ('_style_outline_menubutton', '_style_solid_menubutton'),
+        'progressbar': ('_style_progressbar',),
+        'radiobutton': ('_style_radiobutton',),
+        'treeview': ('_style_treeview',),
+        'separator': ('_style_separator',),
+        'panedwindow': ('_style_panedwindow',)}
+
+    # the order in which the `_style_widget` methods are called
+    build_order = (
+        '_style_spinbox', '_style_scale', '_style_scrollbar', '_style_combobox', '_style_frame', '_style_checkbutton',
+        '_style_entry', '_style_label', '_style_labelframe', '_style_notebook', '_style_outline_buttons',
+        '_style_outline_menubutton', '_style_progressbar', '_style_radiobutton', '_style_solid_buttons',
+        '_style_solid_menubutton', '_style_treeview', '_style_separator', '_style_panedwindow')
+
+    # the widget family that creates the styles of each ttk widget class
+    class_families = {
+        'TSpinbox': 'spinbox', 'TScale': 'scale', 'TScrollbar': 'scrollbar', 'TCombobox': 'combobox',
+        'TFrame': 'frame', 'TCheckbutton': 'checkbutton', 'TEntry': 'entry', 'TLabel': 'label',
+        'TLabelframe': 'labelframe', 'TNotebook': 'notebook', 'TButton': 'button', 'TMenubutton': 'menubutton',
+        'TProgressbar': 'progressbar', 'TRadiobutton': 'radiobutton', 'Treeview': 'treeview',
+        'TSeparator': 'separator', 'TPanedwindow': 'panedwindow', 'Sash': 'panedwindow'}
+
+    def __init__(self, style, definition, cache=None, shades=None, build=True, families=None, variants=None):
         self.style = style
         self.theme = definition
+        self.shades = shades
+        self.selected_families = self.check_families(families)
+        self.variants = self.check_variants(variants)
         self.settings = {}
+        self.script = None
+        self.images = {}
+        self.scale_images = {}
+        self.cache = cache
         self.styler_tk = StylerTK(self)
-        self.create_theme()
+        if build:
+            self.create_theme()
 
     def create_theme(self):
         """
         Create and style a new ttk theme. A wrapper around internal style methods.
         """
+        for _ in self.build_steps():
+            pass
+
+    def build_steps(self):
+        """
+        Create the theme one step at a time. This generator yields the name of each step after it is completed, so
+        that a theme can be built in small slices; the theme is created when the generator is exhausted.
+        """
+        with BuildProfiler.measure(self.theme.name, '_load_cached_settings'):
+            cached = self._load_cached_settings()
+        if cached:
+            yield '_load_cached_settings'
+        else:
+            yield from self._update_steps()
+            with BuildProfiler.measure(self.theme.name, '_store_cached_settings'):
+                self._store_cached_settings()
+        with BuildProfiler.measure(self.theme.name, 'theme_create'):
+            if self.theme.name in self.style.tk.splitlist(self.style.tk.call('ttk::style', 'theme', 'names')):
+                # the theme was unloaded and Tk could not delete it; its styles are replaced and its elements are reused
+                self.style.theme_settings(self.theme.name, self._without_existing_elements(self.settings))
+            else:
+                self.style.tk.call('ttk::style', 'theme', 'create', self.theme.name, '-parent', 'clam',
+                                   '-settings', self.theme_script())
+            ThemeRegistry.get(self.style.master).record_settings(self.theme.name)
+
+    def bundle_steps(self, path, entry, families=None, variants=None):
+        """
+        Create the theme from a bundle of precompiled themes, one step at a time like ``build_steps``. The images
+        are loaded into the shared image cache before the theme script is sourced, so the script reuses them.
+
+        :param Path path: the bundle directory
+        :param dict entry: the manifest entry of the theme
+        :param families: widget families to add to the styles compiled into the bundle
+        :param variants: color variants to add to the styles compiled into the bundle
+        """
+        import base64
+        with BuildProfiler.measure(self.theme.name, '_load_bundled_images'):
+            for shape, color, size, scale, name in entry['images']:
+                data = base64.b64encode((path / 'images' / f'{name}.png').read_bytes()).decode('ascii')
+                self._get_image(shape, color, size, scale, data=data)
+        yield '_load_bundled_images'
+        with BuildProfiler.measure(self.theme.name, '_source_bundled_script'):
+            self.style.tk.call('source', str(path / entry['file']))
+        yield '_source_bundled_script'
+        with BuildProfiler.measure(self.theme.name, 'extend'):
+            self.extend(families or (), variants or ())
+
+    def theme_script(self):
+        """
+        The Tcl script that applies the theme settings, formatted once and reused; the script is saved in the theme
+        cache so a cached theme is created without formatting its settings again.
+
+        :rtype: str
+        """
+        if self.script is None:
+            self.script = ttk._script_from_settings(self.settings)
+        return self.script
+
+    def _without_existing_elements(self, settings):
+        """
+        Remove the element definitions of elements that already exist in the theme; an element cannot be created
+        twice. The images of an element are referred to by name, so the elements of an unloaded theme use the images
+        of the rebuilt theme.
+
+        :param dict settings: theme settings
+
+        :returns: the theme settings without the existing elements
+        :rtype: dict
+        """
+        existing = self.style.tk.splitlist(
+            self.style.tk.call('ttk::style', 'theme', 'settings', self.theme.name, 'ttk::style element names'))
+        result = {}
+        for name, value in settings.items():
+            if name in existing and 'element create' in value:
+                value = {key: option for key, option in value.items() if key != 'element create'}
+            if value:
+                result[name] = value
+        return result
+
+    @classmethod
+    def style_family(cls, stylename):
+        """
+        The widget family and the color variant that create a style
+
+        :param str stylename: a style name, e.g. ``danger.Outline.TButton``
+
+        :returns: the family, or None if the style is not a ttkbootstrap style, e.g. ``success.Toolbutton``, and the
+            color variant, or None for a base style
+        :rtype: tuple
+        """
+        parts = stylename.split('.')
+        variant = parts[0] if len(parts) > 1 and parts[0] in Colors() else None
+        family = next((cls.class_families[part] for part in reversed(parts) if part in cls.class_families), None)
+        return family, variant
+
+    @classmethod
+    def check_families(cls, families):
+        """
+        Validate a selection of widget families
+
+        :param families: widget family names, or ``None`` for all families
+
+        :returns: the selected families in build order
+        :rtype: list
+        """
+        if families is None:
+            return list(cls.families)
+        unknown = set(families) - set(cls.families)
+        if unknown:
+            raise ValueError(f"{', '.join(sorted(unknown))} not a valid widget family. Please try one of the "
+                             f"following: {', '.join(cls.families)}")
+        return [family for family in cls.families if family in families]
+
+    @staticmethod
+    def check_variants(variants):
+        """
+        Validate a selection of color variants
+
+        :param variants: theme color labels, or ``None`` for all colors
+
+        :returns: the selected colors in build order
+        :rtype: list
+        """
+        if variants is None:
+            return list(Colors())
+        unknown = set(variants) - set(Colors())
+        if unknown:
+            raise ValueError(f"{', '.join(sorted(unknown))} not a valid color variant. Please try one of the "
+                             f"following: {', '.join(Colors())}")
+        return [color for color in Colors() if color in variants]
+
+    def extend(self, families=(), variants=()):
+        """
+        Add the styles of more widget families and color variants to a theme that has already been created.
+
+        :param families: the widget families to add
+        :param variants: the color variants to add
+        """
+        families = self.check_families(set(self.selected_families) | set(families))
+        variants = self.check_variants(set(self.variants) | set(variants))
+        if families == self.selected_families and variants == self.variants:
+            return
+        previous = dict(self.settings)
+        self.selected_families = families
+        self.variants = variants
         self.update_ttk_theme_settings()
-        self.style.theme_create(self.theme.name, 'clam', self.settings)
+        # only apply new or changed styles; elements cannot be created twice, so existing elements are skipped.
+        # Settings loaded from the theme cache contain lists instead of tuples, so they are compared in their json form.
+        import json
+        changes = {name: value for name, value in self.settings.items()
+                   if json.dumps(previous.get(name), sort_keys=True) != json.dumps(value, sort_keys=True)}
+        self.style.theme_settings(self.theme.name, self._without_existing_elements(changes))
+        ThemeRegistry.get(self.style.master).record_settings(self.theme.name, changes)
+        self.script = None
+
+    def _cache_key(self):
+        """
+        The cache key of this theme; the settings also depend on the platform elements that are available and on the
+        widget families and color variants that are built.
+        """
+        return ThemeCache.key(self.theme, xpnative='xpnative' in self.style.theme_names(),
+                              families=self.selected_families, variants=self.variants)
+
+    def _load_cached_settings(self):
+        """
+        Load the theme settings and images from the theme cache
+
+        :returns: whether the settings were found in the cache
+        :rtype: bool
+        """
+        if not self.cache:
+            return False
+        entry = self.cache.load(self.theme.name, self._cache_key())
+        if not entry:
+            return False
+        try:
+            for shape, color, size, scale, data in entry['images']:
+                self._get_image(shape, color, size, scale, data=data)
+            self.script = entry['script']
+            self.settings = entry['settings']
+        except (KeyError, TypeError, ValueError, tkinter.TclError):
+            self.release_images()
+            return False
+        return True
+
+    def _store_cached_settings(self):
+        """
+        Save the theme settings and images to the theme cache
+        """
+        if not self.cache:
+            return
+        try:
+            images = [[*spec, self._image_data(image)] for spec, image in self.images.values()]
+        except tkinter.TclError:
+            return
+        self.cache.store(self.theme.name, self._cache_key(),
+                         {'settings': self.settings, 'script': self.theme_script(), 'images': images})
+
+    def _image_data(self, image):
+        """
+        Export an image as base64 encoded png data
+
+        :param image: a ``PhotoImage`` used by this theme
+
+        :rtype: str
+        """
+        data = self.style.tk.call(str(image), 'data', '-format', 'png')
+        if isinstance(data, bytes):
+            import base64
+            return base64.b64encode(data).decode('ascii')
+        return str(data)
+
+    def _get_image(self, shape, color, size, scale=1, data=None):
+        """
+        Get an image from the shared image cache. Each image is acquired only once per theme.
+
+        :returns: the name of the image
+        :rtype: str
+        """
+        name = ImageCache.image_name(shape, color, size, scale)
+        if name not in self.images:
+            image = ImageCache.acquire(self.style.master, shape, color, size, scale, data=data)
+            self.images[name] = ((shape, color, size, scale), image)
+        return name
+
+    def release_images(self):
+        """
+        Return the images used by this theme to the shared image cache
+        """
+        for _, image in self.images.values():
+            ImageCache.release(self.style.master, image)
+        self.images = {}
+        self.scale_images = {}
 
     def update_ttk_theme_settings(self):
         """
         Update the settings dictionary that is used to create a theme. This is a wrapper on all the `_style_widget`
         methods which define the layout, configuration, and styling mapping for each ttk widget.
         """
-        self._style_defaults()
-        self._style_spinbox()
-        self._style_scale()
-        self._style_scrollbar()
-        self._style_combobox()
-        self._style_frame()
-        self._style_checkbutton()
-        self._style_entry()
-        self._style_label()
-        self._style_labelframe()
-        self._style_notebook()
-        self._style_outline_buttons()
-        self._style_outline_menubutton()
-        self._style_progressbar()
-        self._style_radiobutton()
-        self._style_solid_buttons()
-        self._style_solid_menubutton()
-        self._style_treeview()
-        self._style_separator()
-        self._style_panedwindow()
-        pass
+        for _ in self._update_steps():
+            pass
+
+    def _update_steps(self):
+        """
+        Run the `_style_widget` methods one at a time, yielding the name of each method after it is called.
+        """
+        if not self.shades:
+            with BuildProfiler.measure(self.theme.name, 'derive_shades'):
+                self.shades = self.theme.colors.derive()
+        with BuildProfiler.measure(self.theme.name, '_style_defaults'):
+            self._style_defaults()
+        yield '_style_defaults'
+        selected = {name for family in self.selected_families for name in self.families[family]}
+        for name in self.build_order:
+            if name in selected:
+                with BuildProfiler.measure(self.theme.name, name):
+                    getattr(self, name)()
+                yield name
 
     def _style_defaults(self):
         """
@@ -616,7 +2026,8 @@ class StylerTTK:
             self.settings.update({
                 'combo.Spinbox.field': {'element create': ('from', 'default')}})
 
-        for color in self.theme.colors:
+        # variations inherit the ``arrowcolor`` map from ``TCombobox``
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TCombobox': {
                     'map': {
@@ -628,11 +2039,7 @@ class StylerTTK:
                             ('pressed', self.theme.colors.get(color))],
                         'darkcolor': [
                             ('focus', self.theme.colors.get(color)),
-                            ('pressed', self.theme.colors.get(color))],
-                        'arrowcolor': [
-                            ('pressed', self.theme.colors.light),
-                            ('focus', self.theme.colors.inputfg),
-                            ('hover', self.theme.colors.primary)]}}})
+                            ('pressed', self.theme.colors.get(color))]}}})
 
     def _style_separator(self):
         """
@@ -654,7 +2061,7 @@ class StylerTTK:
                     'background': (
                         self.theme.colors.border if self.theme.type == 'light' else self.theme.colors.primary)}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.Horizontal.TSeparator': {
                     'configure': {
@@ -678,10 +2085,10 @@ class StylerTTK:
             'TProgressbar': {'configure': {
                 'thickness': 20,
                 'borderwidth': 0,
-                'troughcolor': Colors.brightness(self.theme.colors.light, -0.05),
+                'troughcolor': self.shades['light'][-0.05],
                 'background': self.theme.colors.primary}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.Horizontal.TProgressbar': {
                     'configure': {
@@ -690,22 +2097,6 @@ class StylerTTK:
                     'configure': {
                         'background': self.theme.colors.get(color)}}})
 
-    @staticmethod
-    def _create_slider_image(color, size=18):
-        """
-        Create a circle slider image based on given size and color; used in the slider widget.
-
-        :param str color: a hexadecimal color value
-        :param int size: the size diameter of the slider circle.
-
-        :returns: An image draw in the shape of a circle of the theme color specified
-        :rtype: ImageTk.PhotoImage
-        """
-        im = Image.new('RGBA', (100, 100))
-        draw = ImageDraw.Draw(im)
-        draw.ellipse((0, 0, 95, 95), fill=color)
-        return ImageTk.PhotoImage(im.resize((size, size), Image.LANCZOS))
-
     def _style_scale(self):
         """
         Create style configuration for ttk scale: *ttk.Scale*
@@ -715,14 +2106,13 @@ class StylerTTK:
             - Scale.trough: borderwidth, troughcolor, troughrelief
             - Scale.slider: sliderlength, sliderthickness, sliderrelief, borderwidth, background, bordercolor, orient
         """
-        # create widget images
-        self.scale_images = {
-            'primary_regular': self._create_slider_image(self.theme.colors.primary),
-            'primary_pressed': self._create_slider_image(
-                Colors.brightness(self.theme.colors.primary, -0.2)),
-            'primary_hover': self._create_slider_image(
-                Colors.brightness(self.theme.colors.primary, -0.1)), 'trough': ImageTk.PhotoImage(
-                Image.new('RGB', (8, 8), Colors.brightness(self.theme.colors.light, -0.05)))}
+        # create widget images; identical images are shared between themes by the image cache
+        self.scale_images['trough'] = self._get_image('square', self.shades['light'][-0.05], 8)
+        for color in ['primary'] + [c for c in self.variants if c != 'primary']:
+            self.scale_images.update({
+                f'{color}_regular': self._get_image('circle', self.theme.colors.get(color), 18),
+                f'{color}_pressed': self._get_image('circle', self.shades[color][-0.2], 18),
+                f'{color}_hover': self._get_image('circle', self.shades[color][-0.1], 18)})
 
         # The layout is derived from the 'xpnative' theme
         self.settings.update({
@@ -742,34 +2132,24 @@ class StylerTTK:
                                   ('pressed', self.scale_images['primary_pressed']),
                                   ('hover', self.scale_images['primary_hover']))}})
 
-        for color in self.theme.colors:
-            self.scale_images.update({
-                f'{color}_regular': self._create_slider_image(self.theme.colors.get(color)),
-                f'{color}_pressed': self._create_slider_image(Colors.brightness(self.theme.colors.get(color), -0.2)),
-                f'{color}_hover': self._create_slider_image(
-                    Colors.brightness(self.theme.colors.get(color), -0.1)), f'{color}_trough': ImageTk.PhotoImage(
-                    Image.new('RGB', (8, 8), Colors.brightness(self.theme.colors.light, -0.05)))})
-
-            # The layout is derived from the 'xpnative' theme
+        for color in self.variants:
+            # The layout is derived from the 'xpnative' theme. An image element cannot take its images from the style,
+            # so each color needs its own slider element and layouts; both orientations share the slider element.
             self.settings.update({
                 f'{color}.Horizontal.TScale': {
                     'layout': [
                         ('Scale.focus', {'expand': '1', 'sticky': 'nswe', 'children': [
                             ('Horizontal.Scale.track', {'sticky': 'we'}),
-                            (f'{color}.Horizontal.Scale.slider', {'side': 'left', 'sticky': ''})]})]},
+                            (f'{color}.Scale.slider', {'side': 'left', 'sticky': ''})]})]},
                 f'{color}.Vertical.TScale': {
                     'layout': [
-                        (f'{color}.Scale.focus', {'expand': '1', 'sticky': 'nswe', 'children': [
+                        ('Scale.focus', {'expand': '1', 'sticky': 'nswe', 'children': [
                             ('Vertical.Scale.track', {'sticky': 'ns'}),
-                            (f'{color}.Vertical.Scale.slider', {'side': 'top', 'sticky': ''})]})]},
-                f'{color}.Vertical.Scale.slider': {'element create':
-                                     ('image', self.scale_images[f'{color}_regular'],
-                                      ('pressed', self.scale_images[f'{color}_pressed']),
-                                      ('hover', self.scale_images[f'{color}_hover']))},
-                f'{color}.Horizontal.Scale.slider': {'element create':
-                                                       ('image', self.scale_images[f'{color}_regular'],
-                                                        ('pressed', self.scale_images[f'{color}_pressed']),
-                                                        ('hover', self.scale_images[f'{color}_hover']))}})
+                            (f'{color}.Scale.slider', {'side': 'top', 'sticky': ''})]})]},
+                f'{color}.Scale.slider': {'element create':
+                                              ('image', self.scale_images[f'{color}_regular'],
+                                               ('pressed', self.scale_images[f'{color}_pressed']),
+                                               ('hover', self.scale_images[f'{color}_hover']))}})
 
     def _style_scrollbar(self):
         """
@@ -797,7 +2177,7 @@ class StylerTTK:
                 'relief': 'flat',
                 'troughborderwidth': 2,
                 'troughcolor': self.theme.colors.light,
-                'background': Colors.brightness(self.theme.colors.light, -0.1),
+                'background': self.shades['light'][-0.1],
                 'arrowsize': 16,
                 'arrowcolor': self.theme.colors.inputfg}}})
 
@@ -859,7 +2239,7 @@ class StylerTTK:
                         ('focus', self.theme.colors.inputfg),
                         ('hover', self.theme.colors.inputfg)]}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TSpinbox': {
                     'map': {
@@ -925,7 +2305,7 @@ class StylerTTK:
                     'padding': 5}},
             'Treeitem.indicator': {'element create': ('from', 'alt')}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.Treeview.Heading': {
                     'configure': {
@@ -944,7 +2324,7 @@ class StylerTTK:
         self.settings.update({
             'TFrame': {'configure': {'background': self.theme.colors.bg}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TFrame': {'configure': {'background': self.theme.colors.get(color)}}})
 
@@ -975,44 +2355,40 @@ class StylerTTK:
                     'padding': (10, 5)},
                 'map': {
                     'background': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'bordercolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'darkcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'lightcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))]}}})
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])]}}})
 
-        for color in self.theme.colors:
+        # variations inherit from ``TButton`` and only override the color dependent options
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TButton': {
                     'configure': {
-                        'foreground': self.theme.colors.selectfg,
                         'background': self.theme.colors.get(color),
                         'bordercolor': self.theme.colors.get(color),
                         'darkcolor': self.theme.colors.get(color),
-                        'lightcolor': self.theme.colors.get(color),
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
+                        'lightcolor': self.theme.colors.get(color)},
                     'map': {
                         'background': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'bordercolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'darkcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'lightcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))]}}})
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])]}}})
 
     def _style_outline_buttons(self):
         """
@@ -1044,47 +2420,38 @@ class StylerTTK:
                         ('pressed', self.theme.colors.selectfg),
                         ('hover', self.theme.colors.selectfg)],
                     'background': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'bordercolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'darkcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'lightcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))]}}})
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])]}}})
 
-        for color in self.theme.colors:
+        # variations inherit from ``Outline.TButton`` and only override the color dependent options
+        for color in self.variants:
             self.settings.update({
                 f'{color}.Outline.TButton': {
                     'configure': {
                         'foreground': self.theme.colors.get(color),
-                        'background': self.theme.colors.bg,
-                        'bordercolor': self.theme.colors.get(color),
-                        'darkcolor': self.theme.colors.bg,
-                        'lightcolor': self.theme.colors.bg,
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
+                        'bordercolor': self.theme.colors.get(color)},
                     'map': {
-                        'foreground': [
-                            ('pressed', self.theme.colors.selectfg),
-                            ('hover', self.theme.colors.selectfg)],
                         'background': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'bordercolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'darkcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'lightcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))]}}})
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])]}}})
 
     def _style_entry(self):
         """
@@ -1116,7 +2483,7 @@ class StylerTTK:
                         ('focus', self.theme.colors.primary),
                         ('hover', self.theme.colors.primary)]}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TEntry': {
                 'map': {
@@ -1163,13 +2530,13 @@ class StylerTTK:
                         ('active', self.theme.colors.primary if (self.theme.type == 'light') else 'black')]}}})
 
         # variations change the indicator color
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TRadiobutton': {
                     'map': {
-                        'foreground': [('active', Colors.brightness(self.theme.colors.get(color), -0.2))],
+                        'foreground': [('active', self.shades[color][-0.2])],
                         'indicatorforeground': [
-                            ('active', Colors.brightness(self.theme.colors.get(color), -0.2))]}}})
+                            ('active', self.shades[color][-0.2])]}}})
 
     def _style_label(self):
         """
@@ -1186,7 +2553,7 @@ class StylerTTK:
             'TLabel': {'configure': {'foreground': self.theme.colors.fg}}})
 
         # self.style.configure('TLabel', foreground=self.settings.colors.fg)
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TLabel': {
                     'configure': {
@@ -1215,7 +2582,7 @@ class StylerTTK:
                 'configure': {
                     'foreground': self.theme.colors.fg}}})
 
-        for color in self.theme.colors:
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TLabelframe': {
                     'configure': {
@@ -1256,26 +2623,25 @@ class StylerTTK:
                     'indicatorforeground': self.theme.colors.selectfg},
                 'map': {
                     'indicatorbackground': [
-                        ('active selected', Colors.brightness(self.theme.colors.primary, -0.2)),
+                        ('active selected', self.shades['primary'][-0.2]),
                         ('selected', self.theme.colors.fg),
                         ('active !selected', self.theme.colors.light)],
                     'foreground': [
                         ('active', self.theme.colors.primary)]}}})
 
-        # variations change indicator color
-        for color in self.theme.colors:
+        # variations change indicator color; the other ``indicatorbackground`` states are inherited from
+        # ``TCheckbutton`` because a style map is searched before the map of its parent style
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TCheckbutton': {
                     'map': {
                         'indicatorbackground': [
-                            ('active selected', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('selected', self.theme.colors.fg),
-                            ('active !selected', self.theme.colors.light)],
+                            ('active selected', self.shades[color][-0.2])],
                         'indicatorforeground': [
-                            ('active selected', Colors.brightness(self.theme.colors.get(color), -0.2)),
+                            ('active selected', self.shades[color][-0.2]),
                             ('selected', self.theme.colors.get(color))],
                         'foreground': [
-                            ('active', Colors.brightness(self.theme.colors.get(color), -0.2))]}}})
+                            ('active', self.shades[color][-0.2])]}}})
 
     def _style_solid_menubutton(self):
         """
@@ -1306,46 +2672,40 @@ class StylerTTK:
                     'padding': (10, 5)},
                 'map': {
                     'background': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'bordercolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'darkcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'lightcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))]}}})
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])]}}})
 
-        for color in self.theme.colors:
+        # variations inherit from ``TMenubutton`` and only override the color dependent options
+        for color in self.variants:
             self.settings.update({
                 f'{color}.TMenubutton': {
                     'configure': {
-                        'foreground': self.theme.colors.selectfg,
                         'background': self.theme.colors.get(color),
                         'bordercolor': self.theme.colors.get(color),
                         'darkcolor': self.theme.colors.get(color),
-                        'lightcolor': self.theme.colors.get(color),
-                        'arrowcolor': self.theme.colors.bg if self.theme.type == 'light' else 'white',
-                        'arrowpadding': (0, 0, 15, 0),
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
+                        'lightcolor': self.theme.colors.get(color)},
                     'map': {
                         'background': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'bordercolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'darkcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'lightcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))]}}})
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])]}}})
 
     def _style_outline_menubutton(self):
         """
@@ -1380,55 +2740,42 @@ class StylerTTK:
                         ('pressed', self.theme.colors.selectfg),
                         ('hover', self.theme.colors.selectfg)],
                     'background': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'bordercolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'darkcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'lightcolor': [
-                        ('pressed', Colors.brightness(self.theme.colors.primary, -0.2)),
-                        ('hover', Colors.brightness(self.theme.colors.primary, -0.1))],
+                        ('pressed', self.shades['primary'][-0.2]),
+                        ('hover', self.shades['primary'][-0.1])],
                     'arrowcolor': [
                         ('pressed', self.theme.colors.selectfg),
                         ('hover', self.theme.colors.selectfg)]}}})
 
-        for color in self.theme.colors:
+        # variations inherit from ``Outline.TMenubutton`` and only override the color dependent options
+        for color in self.variants:
             self.settings.update({
                 f'{color}.Outline.TMenubutton': {
                     'configure': {
                         'foreground': self.theme.colors.get(color),
-                        'background': self.theme.colors.bg,
                         'bordercolor': self.theme.colors.get(color),
-                        'darkcolor': self.theme.colors.bg,
-                        'lightcolor': self.theme.colors.bg,
-                        'arrowcolor': self.theme.colors.get(color),
-                        'arrowpadding': (0, 0, 15, 0),
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
+                        'arrowcolor': self.theme.colors.get(color)},
                     'map': {
-                        'foreground': [
-                            ('pressed', self.theme.colors.selectfg),
-                            ('hover', self.theme.colors.selectfg)],
                         'background': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'bordercolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'darkcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])],
                         'lightcolor': [
-                            ('pressed', Colors.brightness(self.theme.colors.get(color), -0.2)),
-                            ('hover', Colors.brightness(self.theme.colors.get(color), -0.1))],
-                        'arrowcolor': [
-                            ('pressed', self.theme.colors.selectfg),
-                            ('hover', self.theme.colors.selectfg)]}}})
+                            ('pressed', self.shades[color][-0.2]),
+                            ('hover', self.shades[color][-0.1])]}}})
 
     def _style_notebook(self):
         """
@@ -1488,7 +2835,7 @@ class StylerTTK:
         self.settings.update({
             'TPanedwindow': {
                 'configure': {
-                    'background': Colors.brightness(self.theme.colors.light, -0.1)}},
+                    'background': self.shades['light'][-0.1]}},
             'Sash': {
                 'configure': {
                     'bordercolor': self.theme.colors.inputfg,
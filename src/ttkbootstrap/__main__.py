@@ -1,4 +1,16 @@
+import sys
+
+from . import BuildProfiler
 from .demo import Demo
 
 if __name__ == '__main__':
-    Demo().run()
\ No newline at end of file
+    if sys.argv[1:2] == ['compile']:
+        from .compiler import main
+        main(sys.argv[2:])
+    elif sys.argv[1:2] == ['--profile']:
+        # the report covers the startup and every theme built or applied until the demo is closed
+        with BuildProfiler() as profiler:
+            Demo().run()
+        print(profiler.format_report())
+    else:
+        Demo().run()
@@ -0,0 +1,257 @@
+"""
+asyncio integration: one thread runs both the Tk and the asyncio event loop.
+
+``TkEventLoop`` is an asyncio event loop that waits for its sockets, pipes and timers inside the Tcl notifier, so Tk
+events are processed while asyncio is idle, and asyncio callbacks run as soon as a socket is ready or a Tk callback
+schedules them. Nothing polls on POSIX platforms, where the sockets are watched by Tk file handlers. Elsewhere, Tk file
+handlers are not available; the loop then waits for its sockets in short slices and processes the pending Tk events
+between them, which bounds the latency of both loops by ``poll_interval``.
+
+``run`` replaces both ``mainloop`` and ``asyncio.run``::
+
+    async def main():
+        root = tkinter.Tk()
+        style = Style()
+        ...
+        reader, writer = await asyncio.open_connection(host, port)
+        while True:
+            event = await wait_event(root, '<<ThemeChanged>>')
+            writer.write(style.theme_use().encode())
+
+    run(main())
+
+The awaitable helpers are functions of this module that take the widget, like ``wait_event(widget, sequence)``, so
+that the tkinter widget classes are not patched with extra methods.
+"""
+import math
+import time
+import asyncio
+import tkinter
+import selectors
+from collections.abc import Mapping
+
+
+class _SelectorMapping(Mapping):
+    """
+    The registered file objects of a selector
+    """
+
+    def __init__(self, selector):
+        self._selector = selector
+
+    def __len__(self):
+        return len(self._selector._keys)
+
+    def __getitem__(self, fileobj):
+        return self._selector._keys[self._selector._fileno(fileobj)]
+
+    def __iter__(self):
+        return iter(self._selector._keys)
+
+
+class TkSelector(selectors.BaseSelector):
+    """
+    A selector that waits in the Tcl notifier, processing Tk events, until a registered file is ready. Files are
+    watched with Tk file handlers.
+    """
+
+    def __init__(self, tk):
+        """
+        :param tk: the Tcl interpreter that owns the file handlers; any interpreter of the thread processes the events
+            of all of them.
+        """
+        self.tk = tk
+        self.woken = False
+        self._keys = {}
+        self._ready = {}
+        self._map = _SelectorMapping(self)
+
+    @staticmethod
+    def _fileno(fileobj):
+        if isinstance(fileobj, int):
+            fd = fileobj
+        else:
+            try:
+                fd = int(fileobj.fileno())
+            except (AttributeError, TypeError, ValueError):
+                raise ValueError(f'{fileobj!r} is not a valid file object') from None
+        if fd < 0:
+            raise ValueError(f'{fd} is not a valid file descriptor')
+        return fd
+
+    def register(self, fileobj, events, data=None):
+        if not events or events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+            raise ValueError(f'{events} is not a valid event mask')
+        fd = self._fileno(fileobj)
+        if fd in self._keys:
+            raise KeyError(f'{fileobj!r} is already registered')
+        key = self._keys[fd] = selectors.SelectorKey(fileobj, fd, events, data)
+        mask = ((tkinter.READABLE if events & selectors.EVENT_READ else 0) |
+                (tkinter.WRITABLE if events & selectors.EVENT_WRITE else 0))
+        self.tk.createfilehandler(fd, mask, self._on_ready)
+        return key
+
+    def unregister(self, fileobj):
+        key = self._keys.pop(self._fileno(fileobj))
+        self._ready.pop(key.fd, None)
+        self.tk.deletefilehandler(key.fd)
+        return key
+
+    def get_map(self):
+        return self._map
+
+    def close(self):
+        for fd in list(self._keys):
+            self.tk.deletefilehandler(fd)
+        self._keys.clear()
+        self._ready.clear()
+
+    def select(self, timeout=None):
+        """
+        Process Tk events until a registered file is ready, the timeout expires or the loop is woken by a callback
+        scheduled from a Tk event handler.
+
+        :param float timeout: the maximum number of seconds to wait; wait indefinitely if None, do not wait if <= 0.
+        """
+        self.woken = False
+        if timeout is not None and timeout <= 0:
+            # process the events that are pending already, but not the ones they generate
+            for _ in range(1000):
+                if not self.tk.dooneevent(tkinter._tkinter.DONT_WAIT) or self._ready or self.woken:
+                    break
+        else:
+            expired = []
+            timer = None
+            if timeout is not None:
+                timer = self.tk.createtimerhandler(max(1, math.ceil(timeout * 1000)), lambda: expired.append(True))
+            try:
+                while not (self._ready or expired or self.woken):
+                    self.tk.dooneevent(0)
+            finally:
+                if timer is not None and not expired:
+                    timer.deletetimerhandler()
+        ready = [(self._keys[fd], events & self._keys[fd].events) for fd, events in self._ready.items()
+                 if fd in self._keys]
+        self._ready.clear()
+        return ready
+
+    def _on_ready(self, fd, mask):
+        events = ((selectors.EVENT_READ if mask & (tkinter.READABLE | tkinter.EXCEPTION) else 0) |
+                  (selectors.EVENT_WRITE if mask & tkinter.WRITABLE else 0))
+        self._ready[fd] = self._ready.get(fd, 0) | events
+
+
+class PollingTkSelector(selectors.DefaultSelector):
+    """
+    A selector for platforms without Tk file handlers: waits for the registered files in slices of ``poll_interval``
+    seconds and processes the pending Tk events between them.
+    """
+
+    def __init__(self, tk, poll_interval=0.01):
+        super().__init__()
+        self.tk = tk
+        self.woken = False
+        self.poll_interval = poll_interval
+
+    def select(self, timeout=None):
+        self.woken = False
+        deadline = None if timeout is None else time.monotonic() + max(0, timeout)
+        while True:
+            for _ in range(1000):
+                if not self.tk.dooneevent(tkinter._tkinter.DONT_WAIT) or self.woken:
+                    break
+            remaining = self.poll_interval if deadline is None else deadline - time.monotonic()
+            ready = super().select(0 if self.woken else max(0, min(remaining, self.poll_interval)))
+            if ready or self.woken or (deadline is not None and remaining <= self.poll_interval):
+                return ready
+
+
+class TkEventLoop(asyncio.SelectorEventLoop):
+    """
+    An asyncio event loop that also processes Tk events, in the thread that runs Tk
+    """
+
+    def __init__(self, master=None, poll_interval=0.01):
+        """
+        :param master: a widget of the thread's Tcl interpreter; a private interpreter by default. Tk events of all
+            interpreters of the thread are processed either way.
+        :param float poll_interval: the longest delay between checks of the Tk and the asyncio events on platforms
+            without Tk file handlers.
+        """
+        tk = master.tk if master is not None else tkinter.Tcl().tk
+        if hasattr(tk, 'createfilehandler'):
+            selector = TkSelector(tk)
+        else:
+            selector = PollingTkSelector(tk, poll_interval)
+        super().__init__(selector)
+
+    def call_soon(self, callback, *args, **kwargs):
+        # a callback scheduled by a Tk event handler while the loop waits in the Tcl notifier ends the wait
+        handle = super().call_soon(callback, *args, **kwargs)
+        self._selector.woken = True
+        return handle
+
+    def call_at(self, when, callback, *args, **kwargs):
+        handle = super().call_at(when, callback, *args, **kwargs)
+        self._selector.woken = True
+        return handle
+
+
+def run(main, master=None, debug=None):
+    """
+    Run a coroutine in a ``TkEventLoop`` until it completes, like ``asyncio.run``, processing Tk events meanwhile
+
+    :param main: the coroutine
+    :param master: a widget of the thread's Tcl interpreter; see ``TkEventLoop``
+    :param bool debug: run the event loop in debug mode
+
+    :returns: the result of the coroutine
+    """
+    loop = TkEventLoop(master)
+    try:
+        asyncio.set_event_loop(loop)
+        if debug is not None:
+            loop.set_debug(debug)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+async def wait_event(widget, sequence):
+    """
+    Wait until an event occurs on a widget, e.g. ``await wait_event(root, '<<ThemeChanged>>')``. The widget's other
+    bindings of the sequence are kept.
+
+    :param widget: the widget
+    :param str sequence: the event sequence, as for ``bind``
+
+    :returns: the event
+    :rtype: tkinter.Event
+    """
+    future = asyncio.get_running_loop().create_future()
+
+    def handler(event):
+        if not future.done():
+            future.set_result(event)
+
+    funcid = widget.bind(sequence, handler, '+')
+    try:
+        return await future
+    finally:
+        # Misc.unbind removes all bindings of the sequence, so only the line of this binding is removed
+        try:
+            script = widget.tk.call('bind', widget._w, sequence)
+            lines = [line for line in str(script).split('\n') if funcid not in line]
+            widget.tk.call('bind', widget._w, sequence, '\n'.join(lines))
+            widget.deletecommand(funcid)
+        except tkinter.TclError:
+            # the widget was destroyed along with its bindings
+            pass
@@ -0,0 +1,75 @@
+"""
+Batch derivation of theme shades for large collections of palettes. Requires NumPy.
+
+Deriving the pressed, hover, and trough shades of hundreds of palettes with ``Colors.brightness`` one color at a time
+is slow. ``derive_shades`` computes them for a whole collection at once and returns them in the same structure as
+``Colors.derive``, which can be passed to ``StylerTTK`` directly::
+
+    palettes = palette_array(colors_list)
+    for definition, shades in zip(definitions, derive_shades(palettes)):
+        StylerTTK(style, definition, shades=shades)
+
+The results are identical to the scalar ``Colors.brightness`` implementation.
+"""
+from ttkbootstrap import Colors, _hex_to_int_rgb
+
+LABELS = tuple(Colors.label_iter())
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('ttkbootstrap.batch requires NumPy: pip install numpy') from None
+    return numpy
+
+
+def palette_array(palettes):
+    """
+    Convert a sequence of palettes into an integer rgb array
+
+    :param palettes: a sequence of ``Colors`` instances, or of sequences of 13 hexadecimal colors in the order of
+        ``Colors.label_iter``
+
+    :returns: an array of shape (N, 13, 3)
+    :rtype: numpy.ndarray
+    """
+    np = _numpy()
+    rows = []
+    for palette in palettes:
+        if isinstance(palette, Colors):
+            palette = [palette.get(label) for label in LABELS]
+        rows.append([_hex_to_int_rgb(color) for color in palette])
+    return np.array(rows, dtype=np.int64).reshape(-1, len(LABELS), 3)
+
+
+def derive_shades(palettes, pct_changes=(-0.2, -0.1, -0.05)):
+    """
+    Adjust the brightness of every color of every palette by each of the percent changes.
+
+    :param palettes: an array of shape (N, 13) of hexadecimal colors, an integer rgb array of shape (N, 13, 3), or a
+        sequence of ``Colors`` instances. Colors are in the order of ``Colors.label_iter``.
+    :param tuple pct_changes: the brightness changes to apply; these are the changes used to build a theme by default.
+
+    :returns: one dictionary per palette in the format returned by ``Colors.derive``
+    :rtype: list[dict]
+    """
+    np = _numpy()
+    rgb = np.asarray(palettes)
+    if rgb.dtype.kind not in 'iu':
+        rgb = palette_array(palettes)
+    rgb = rgb.astype(np.int64).reshape(-1, len(LABELS), 3)
+
+    # the same operations, in the same order, as the scalar implementation so the floating point results are identical
+    v = rgb.max(axis=2, keepdims=True)
+    safe_v = np.where(v == 0, 1, v)
+    shaded = {}
+    for pct in pct_changes:
+        v_ = np.minimum(255.0, np.maximum(0.0, (1 + pct) * v))
+        channels = np.floor(rgb * v_ / safe_v + 0.5).astype(np.int64)
+        channels[(v == 0).repeat(3, axis=2)] = 0
+        values = (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
+        shaded[pct] = [['#%06x' % value for value in row] for row in values.tolist()]
+
+    return [{label: {pct: shaded[pct][i][j] for pct in pct_changes} for j, label in enumerate(LABELS)}
+            for i in range(rgb.shape[0])]
@@ -0,0 +1,144 @@
+"""
+Ahead-of-time compiler for ttkbootstrap themes.
+
+Each theme is built once and written as a standalone Tcl package: a script that creates the theme, and the PNG images
+used by its elements. The bundle directory looks like this::
+
+    pkgIndex.tcl
+    manifest.json
+    flatly.tcl
+    images/ttkbootstrap_circle__2c3e50_18_1.png
+    ...
+
+Compile the bundled themes, or only some of them::
+
+    python -m ttkbootstrap compile build/themes
+    python -m ttkbootstrap compile build/themes --theme flatly --theme darkly
+
+A Python application creates the themes from the bundle instead of building them::
+
+    style = Style('flatly', bundle='build/themes')
+
+A Tcl application loads a theme as a package::
+
+    lappend auto_path build/themes
+    package require ttk::theme::flatly
+    ttk::style theme use flatly
+
+The settings of some widgets depend on the native elements of the platform, so a bundle should be compiled on the
+platform it is used on. Compiling requires a display.
+"""
+import json
+import argparse
+from pathlib import Path
+import tkinter
+from tkinter import ttk
+
+from ttkbootstrap import Style, ThemeCache, __version__
+
+# the Tcl script that creates one theme; images that already exist are shared with the themes that created them
+THEME_SCRIPT = """\
+# {name} theme compiled by ttkbootstrap {version}
+package require Tk 8.6
+
+namespace eval ttk::theme::{package} {{
+    variable dir [file dirname [info script]]
+    foreach image {images} {{
+        if {{$image ni [image names]}} {{
+            image create photo $image -file [file join $dir images $image.png]
+        }}
+    }}
+    if {{[lsearch -exact [ttk::style theme names] {qname}] < 0}} {{
+        ttk::style theme create {qname} -parent clam -settings {{
+{script}
+        }}
+    }}
+}}
+
+package provide ttk::theme::{package} {version}
+"""
+
+
+def compile_themes(path, themenames=None, families=None, variants=None, master=None):
+    """
+    Build themes and write them to a bundle directory
+
+    :param str path: the bundle directory; created if it does not exist
+    :param themenames: the themes to compile; all registered themes by default
+    :param families: the widget families to build styles for; all by default
+    :param variants: the color variants to build styles for; all by default
+    :param master: the widget whose interpreter builds the themes; a new hidden window by default
+
+    :returns: the manifest of the bundle
+    :rtype: dict
+    """
+    path = Path(path)
+    (path / 'images').mkdir(parents=True, exist_ok=True)
+    root = master or tkinter.Tk()
+    if master is None:
+        root.withdraw()
+    try:
+        style = Style(master=root, cache=False, families=families, variants=variants)
+        if themenames is None:
+            themenames = list(style._theme_definitions)
+        unknown = [name for name in themenames if name not in style._theme_definitions]
+        if unknown:
+            raise ValueError(f"{', '.join(unknown)} not a valid theme name. Please try one of the following: "
+                             f"{', '.join(style._theme_definitions)}")
+
+        manifest = {
+            'version': __version__,
+            'xpnative': 'xpnative' in ttk.Style.theme_names(style),
+            'families': style.families,
+            'variants': style.variants,
+            'themes': []}
+        index = []
+        for themename in themenames:
+            styler, _ = style._start_build(themename)
+            styler.update_ttk_theme_settings()
+            package = ThemeCache._safe_name(themename)
+            images = []
+            for name, (spec, image) in styler.images.items():
+                style.tk.call(str(image), 'write', str(path / 'images' / f'{name}.png'), '-format', 'png')
+                images.append([*spec, name])
+            script = THEME_SCRIPT.format(
+                name=themename, version=__version__, package=package, qname=tkinter._stringify(themename),
+                images=tkinter._stringify(tuple(name for *_, name in images)),
+                script=styler.theme_script().strip('\n'))
+            (path / f'{package}.tcl').write_text(script, encoding='utf-8')
+            index.append(f'package ifneeded ttk::theme::{package} {__version__} '
+                         f'[list source [file join $dir {package}.tcl]]')
+            definition = styler.theme
+            manifest['themes'].append({
+                'name': definition.name,
+                'type': definition.type,
+                'font': definition.font,
+                'colors': {label: definition.colors.get(label) for label in definition.colors.label_iter()},
+                'file': f'{package}.tcl',
+                'images': images})
+            styler.release_images()
+
+        (path / 'pkgIndex.tcl').write_text('\n'.join(index) + '\n', encoding='utf-8')
+        (path / 'manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    finally:
+        if master is None:
+            root.destroy()
+    return manifest
+
+
+def main(argv=None):
+    """
+    The ``python -m ttkbootstrap compile`` command
+    """
+    parser = argparse.ArgumentParser(prog='python -m ttkbootstrap compile',
+                                     description='Compile ttkbootstrap themes into a bundle of Tcl theme packages.')
+    parser.add_argument('path', help='the bundle directory')
+    parser.add_argument('--theme', action='append', dest='themes', metavar='NAME',
+                        help='a theme to compile; may be repeated. All themes are compiled by default.')
+    parser.add_argument('--family', action='append', dest='families', metavar='NAME',
+                        help='a widget family to build styles for; may be repeated. All by default.')
+    parser.add_argument('--variant', action='append', dest='variants', metavar='COLOR',
+                        help='a color to build style variants for; may be repeated. All by default.')
+    args = parser.parse_args(argv)
+    manifest = compile_themes(args.path, args.themes, args.families, args.variants)
+    print(f"compiled {len(manifest['themes'])} themes to {args.path}")
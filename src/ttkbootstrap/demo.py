@@ -7,9 +7,6 @@ from ttkbootstrap import Style
 import tkinter
 from tkinter import ttk
 
-# for taking screenshots
-from PIL import ImageGrab
-
 
 class Demo(Style):
     """
@@ -17,7 +14,8 @@ class Demo(Style):
     """
 
     def __init__(self):
-        super().__init__()
+        # the other themes are built while the demo is idle, so the theme menu switches instantly
+        super().__init__(prebuild=True)
         self.theme_use('lumen')
         self.root = self.master
         self.root.protocol("WM_DELETE_WINDOW", self.quit)
@@ -43,16 +41,10 @@ class Demo(Style):
 
     def change_theme(self, new_theme):
         """
-        Destroying the widget isn't strictly necessary with pure TTK widgets. However, for this demo, I'm
-        explicitly allowing the changing of colors, etc... and because I want the styles to be consistent on underlying
-        standard tk widgets, I've choosing to redraw all the widgets in the main tab. You can use other methods or
-        avoid this altogether if you're not switch between light and dark themes.
+        The widgets don't need to be redrawn; ``theme_use`` restyles the existing standard tk widgets as well as the
+        ttk widgets, even when switching between light and dark themes.
         """
-        self.tab.destroy()
         self.theme_use(new_theme)
-        self.tab = self.create_themed_tab()
-        self.nb.insert(0, self.tab, text='Tab 1')
-        self.nb.select(self.nb.tabs()[0])
         self.theme_name.set(new_theme)
 
     def create_themed_tab(self):
@@ -200,7 +192,8 @@ class Demo(Style):
         self.root.after_idle(self.save_screenshot, [x1, y1, x2, y2])
 
     def save_screenshot(self, bbox):
-        # screenshot
+        # screenshot; Pillow is only imported when a screenshot is taken
+        from PIL import ImageGrab
         img = ImageGrab.grab(bbox=bbox)
 
         # image name
@@ -0,0 +1,203 @@
+"""
+Thread-safe dispatch of callbacks to the Tk thread.
+
+Tk may only be used from the thread that created the interpreter. Worker threads post callbacks to the dispatcher of
+the interpreter instead of polling a queue from the Tk thread::
+
+    dispatcher = Dispatcher.get(root)
+
+    def worker():
+        for row in rows():
+            dispatcher.post(tree.insert, '', 'end', values=row)
+
+The first callback posted to an empty queue wakes the Tk event loop once: through a pipe watched by a Tk file handler
+on POSIX platforms, and with a virtual event elsewhere. The queued callbacks are then run in batches; a batch stops
+when it exceeds the frame budget, and the next batch runs after pending events and redraws have been processed, so
+the application stays responsive while thousands of callbacks per second are delivered.
+"""
+import os
+import sys
+import time
+import tkinter
+from threading import Lock
+from collections import deque
+
+
+class Dispatcher:
+    """
+    Runs callbacks posted from any thread on the Tk thread of an interpreter. Create the dispatcher on the Tk thread;
+    ``post`` may be called from any thread. The dispatcher is closed when the root window is destroyed.
+    """
+    _interps = {}
+
+    # the virtual event that wakes the event loop when file handlers are not available
+    wake_event = '<<TtkbootstrapDispatch>>'
+
+    def __init__(self, master=None, budget=8):
+        """
+        :param master: a widget of the interpreter that runs the callbacks; the default root window by default.
+        :param budget: the maximum number of milliseconds spent running callbacks before pending events and redraws
+            are processed.
+        """
+        self.master = master or tkinter._default_root
+        if self.master is None:
+            raise RuntimeError('there is no Tcl interpreter to dispatch to; create a Tk window first')
+        self.budget = budget / 1000
+        self._queue = deque()
+        self._lock = Lock()
+        self._woken = False
+        self._closed = False
+        self._pipe = None
+        self._scheduled = None
+        if hasattr(self.master.tk, 'createfilehandler') and hasattr(os, 'set_blocking'):
+            self._pipe = os.pipe()
+            os.set_blocking(self._pipe[0], False)
+            os.set_blocking(self._pipe[1], False)
+            self.master.tk.createfilehandler(self._pipe[0], tkinter.READABLE, self._on_readable)
+        else:
+            self._binding = self.master._root().bind(self.wake_event, lambda event: self.drain(), '+')
+        try:
+            # a function of the module, so that the binding does not keep the dispatcher alive
+            self.master._root().bind('<Destroy>', _root_destroyed, '+')
+        except tkinter.TclError:
+            # an interpreter without Tk has no root window; close the dispatcher to release it
+            pass
+
+    @classmethod
+    def get(cls, master):
+        """
+        Get the dispatcher of an interpreter, creating it if it does not exist yet. Must be called on the Tk thread
+        the first time.
+
+        :param master: a widget of the interpreter
+
+        :rtype: Dispatcher
+        """
+        interp = master.tk
+        dispatcher = cls._interps.get(interp)
+        if dispatcher is None:
+            dispatcher = cls._interps[interp] = cls(master)
+        return dispatcher
+
+    def post(self, func, *args, **kwargs):
+        """
+        Run a function on the Tk thread. Safe to call from any thread; returns immediately.
+
+        :param func: the function to run
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('the dispatcher is closed')
+            self._queue.append((func, args, kwargs))
+            if self._woken:
+                return
+            self._woken = True
+        self._wake()
+
+    def pending(self):
+        """
+        The number of callbacks waiting to run
+
+        :rtype: int
+        """
+        return len(self._queue)
+
+    def drain(self, budget=None):
+        """
+        Run queued callbacks on the Tk thread until the queue is empty or the budget is exceeded. The remaining
+        callbacks run after pending events and redraws have been processed. Exceptions raised by callbacks are
+        reported with ``report_callback_exception`` and do not stop the queue.
+
+        :param budget: the maximum number of milliseconds to spend; the budget of the dispatcher by default.
+
+        :returns: the number of callbacks that were run
+        :rtype: int
+        """
+        if self._scheduled is not None:
+            self.master.after_cancel(self._scheduled)
+            self._scheduled = None
+        deadline = time.perf_counter() + (self.budget if budget is None else budget / 1000)
+        count = 0
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._woken = False
+                    return count
+                func, args, kwargs = self._queue.popleft()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                self.master.report_callback_exception(*sys.exc_info())
+            count += 1
+            if time.perf_counter() >= deadline:
+                break
+        # idle callbacks registered now run after the redraws that the batch scheduled; events are processed first
+        self._scheduled = self.master.after_idle(self.drain)
+        return count
+
+    def close(self):
+        """
+        Stop accepting callbacks and release the wake-up resources. Callbacks that have not run yet are discarded.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.clear()
+        if self._scheduled is not None:
+            self.master.after_cancel(self._scheduled)
+            self._scheduled = None
+        if self._pipe is not None:
+            self.master.tk.deletefilehandler(self._pipe[0])
+            for fd in self._pipe:
+                os.close(fd)
+            self._pipe = None
+        else:
+            try:
+                self.master._root().unbind(self.wake_event, self._binding)
+            except tkinter.TclError:
+                # the root window is destroyed already
+                pass
+        interp = self.master.tk
+        if self._interps.get(interp) is self:
+            del self._interps[interp]
+
+    def _wake(self):
+        """
+        Make the Tk event loop call ``drain``
+        """
+        try:
+            if self._pipe is not None:
+                try:
+                    os.write(self._pipe[1], b'\0')
+                except BlockingIOError:
+                    # the pipe is full of unread wake-ups, so the event loop is woken already
+                    pass
+            else:
+                # Tk calls from other threads are queued to the Tk thread, which must be running its event loop
+                self.master._root().event_generate(self.wake_event, when='tail')
+        except (OSError, RuntimeError, tkinter.TclError):
+            # the event loop is not reachable; the next post tries again
+            with self._lock:
+                self._woken = False
+
+    def _on_readable(self, fd, mask):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self.drain()
+
+
+def _root_destroyed(event):
+    """
+    Close the dispatcher of an interpreter when its root window is destroyed; the bindings of the root window also
+    receive the events of its children.
+    """
+    if str(event.widget) == '.':
+        dispatcher = Dispatcher._interps.get(event.widget.tk)
+        if dispatcher is not None:
+            dispatcher.close()
@@ -0,0 +1,501 @@
+"""
+A ``concurrent.futures`` executor whose futures report back on the Tk thread.
+
+Functions run in a thread pool, or a process pool with ``processes=True``. Their results, errors and progress are
+delivered to callbacks on the Tk thread through the ``Dispatcher`` of the interpreter, so the callbacks may use widgets
+freely and nothing polls::
+
+    executor = TkExecutor(root, max_workers=4)
+    executor.bind_progressbar(progressbar)
+
+    def download(url):
+        task = current_task()
+        for done, total in fetch(url):
+            task.check()
+            task.report(done, total)
+        return url
+
+    future = executor.submit(download, url)
+    future.on_done(show).on_error(alert).on_progress(lambda value, maximum: print(value, maximum))
+    cancel_button.configure(command=future.cancel)
+
+Cancellation is cooperative: a future that has not started yet is never run, and a running function sees
+``current_task().cancelled`` or raises ``CancelledError`` from ``current_task().check()``. At most ``max_in_flight``
+functions are handed to the pool at a time; the others wait in the executor, where they can be cancelled for free.
+"""
+import os
+import sys
+import tkinter
+import threading
+from itertools import count
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, wait as wait_futures
+
+from ttkbootstrap.dispatch import Dispatcher
+
+_local = threading.local()
+
+
+def current_task():
+    """
+    The task of the function running in this worker; ``None`` outside of functions submitted to a ``TkExecutor``.
+
+    :rtype: Task
+    """
+    return getattr(_local, 'task', None)
+
+
+def _run_task(func, task, args, kwargs):
+    """
+    Run a submitted function in a worker thread or process
+    """
+    _local.task = task
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.task = None
+
+
+class Task:
+    """
+    The handle of a running function to its future: reports progress and checks for cancellation. Tasks of process
+    pools communicate through a ``multiprocessing.Manager`` and can be pickled.
+    """
+
+    def __init__(self, key, event, channel):
+        self.key = key
+        self._event = event
+        self._channel = channel
+
+    @property
+    def cancelled(self):
+        """
+        Whether cancelling the future was requested
+
+        :rtype: bool
+        """
+        return self._event.is_set()
+
+    def check(self):
+        """
+        Stop the function when cancelling its future was requested
+
+        :raises CancelledError: if cancelling the future was requested
+        """
+        if self._event.is_set():
+            raise CancelledError()
+
+    def report(self, value, maximum=None):
+        """
+        Report the progress of the function. Reports are coalesced, so a function may report as often as it likes;
+        the callbacks receive the latest value.
+
+        :param value: the amount of work done
+        :param maximum: the total amount of work; without it, the progress of the future is not known
+        """
+        self._channel.put((self.key, value, maximum))
+
+
+class TkFuture:
+    """
+    The result of a function submitted to a ``TkExecutor``. Callbacks are called on the Tk thread; a callback added
+    after the future has finished is called as well.
+    """
+
+    def __init__(self, executor, func, args, kwargs, task):
+        self.executor = executor
+        self.task = task
+        self.value = 0
+        self.maximum = None
+        self._call = (func, args, kwargs)
+        self._future = None
+        self._cancelled = False
+        self._delivered = False
+        self._callbacks = {'done': [], 'error': [], 'cancel': [], 'progress': []}
+
+    def on_done(self, func):
+        """
+        Call a function with the result when the function returns
+
+        :returns: this future, so that callbacks can be chained
+        :rtype: TkFuture
+        """
+        return self._add_callback('done', func)
+
+    def on_error(self, func):
+        """
+        Call a function with the exception when the function raises one. Errors without callbacks are reported with
+        ``report_callback_exception``.
+
+        :rtype: TkFuture
+        """
+        return self._add_callback('error', func)
+
+    def on_cancel(self, func):
+        """
+        Call a function without arguments when the future is cancelled
+
+        :rtype: TkFuture
+        """
+        return self._add_callback('cancel', func)
+
+    def on_progress(self, func):
+        """
+        Call a function with the value and the maximum reported by ``Task.report``
+
+        :rtype: TkFuture
+        """
+        return self._add_callback('progress', func)
+
+    def cancel(self):
+        """
+        Cancel the future. A future that has not started is cancelled at once; a running function is asked to stop
+        through its task.
+
+        :returns: False if the future has already finished
+        :rtype: bool
+        """
+        return self.executor._cancel(self)
+
+    def done(self):
+        """
+        Whether the future has finished and its callbacks were called
+
+        :rtype: bool
+        """
+        return self._delivered
+
+    def cancelled(self):
+        """
+        :rtype: bool
+        """
+        if self._cancelled:
+            return True
+        if self._future is None or not self._future.done():
+            return False
+        return self._future.cancelled() or isinstance(self._future.exception(), CancelledError)
+
+    def result(self, timeout=None):
+        """
+        The return value of the function; blocks until the function returns, so avoid calling it on the Tk thread
+        before the future is done.
+
+        :raises CancelledError: if the future was cancelled
+        """
+        if self._future is None:
+            if self._cancelled:
+                raise CancelledError()
+            raise RuntimeError('the future has not started yet')
+        return self._future.result(timeout)
+
+    def exception(self, timeout=None):
+        """
+        The exception raised by the function, or None
+
+        :raises CancelledError: if the future was cancelled
+        """
+        if self._future is None:
+            if self._cancelled:
+                raise CancelledError()
+            raise RuntimeError('the future has not started yet')
+        return self._future.exception(timeout)
+
+    @property
+    def fraction(self):
+        """
+        The part of the work that is done, between 0 and 1; a finished future is complete.
+
+        :rtype: float
+        """
+        if self._delivered:
+            return 1.0
+        if not self.maximum:
+            return 0.0
+        return max(0.0, min(1.0, self.value / self.maximum))
+
+    def _add_callback(self, kind, func):
+        self._callbacks[kind].append(func)
+        if self._delivered and kind != 'progress':
+            self.executor._post(self._call_callbacks, (kind, func))
+        return self
+
+    def _finished_callbacks(self):
+        """
+        The kind of callbacks to call for the outcome of the future, and their arguments
+        """
+        if self.cancelled():
+            return 'cancel', ()
+        error = self._future.exception()
+        if error is not None:
+            return 'error', (error,)
+        return 'done', (self._future.result(),)
+
+    def _call_callbacks(self, late=None):
+        """
+        Call the callbacks of the outcome
+
+        :param late: the kind and the function of a callback added after the future finished, to call only that one
+        """
+        kind, args = self._finished_callbacks()
+        if late is not None:
+            if late[0] == kind:
+                late[1](*args)
+            return
+        if kind == 'error' and not self._callbacks['error']:
+            error = args[0]
+            self.executor.master.report_callback_exception(type(error), error, error.__traceback__)
+        for func in self._callbacks[kind]:
+            func(*args)
+
+
+class _ThreadChannel:
+    """
+    Delivers the progress reports of a thread pool task to its executor
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def put(self, item):
+        self.executor._report(*item)
+
+
+class TkExecutor:
+    """
+    Runs functions in a thread or process pool and delivers their outcome and progress on the Tk thread. Create and
+    use the executor on the Tk thread.
+    """
+
+    def __init__(self, master=None, max_workers=None, processes=False, max_in_flight=None):
+        """
+        :param master: a widget of the interpreter the callbacks run in; the default root window by default.
+        :param int max_workers: the number of worker threads or processes; the defaults of ``ThreadPoolExecutor`` and
+            ``ProcessPoolExecutor`` by default.
+        :param bool processes: run functions in a process pool; the functions and their arguments must be picklable.
+        :param int max_in_flight: the maximum number of functions handed to the pool at a time; twice the number of
+            workers by default.
+        """
+        self.dispatcher = Dispatcher.get(master or tkinter._default_root)
+        self.master = self.dispatcher.master
+        self.processes = processes
+        if max_workers is None:
+            if processes:
+                max_workers = os.cpu_count() or 1
+                if sys.platform == 'win32':
+                    # Windows cannot wait for more than 61 processes
+                    max_workers = min(max_workers, 61)
+            else:
+                max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self._pool = pool(max_workers=max_workers)
+        self.max_in_flight = max_in_flight or 2 * max_workers
+        self._keys = count()
+        self._lock = threading.RLock()
+        self._waiting = deque()
+        self._in_flight = 0
+        self._futures = {}
+        self._progress = {}
+        self._bindings = []
+        self._manager = None
+        self._listener = None
+        self._channel = None if processes else _ThreadChannel(self)
+        self._shutdown = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Run a function in the pool. Returns at once; when ``max_in_flight`` functions are running, the function waits
+        in the executor until one of them finishes.
+
+        :param func: the function; it reaches its task through ``current_task``
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+
+        :rtype: TkFuture
+        """
+        if self._shutdown:
+            raise RuntimeError('cannot submit after shutdown')
+        key = next(self._keys)
+        if self.processes:
+            manager = self._start_manager()
+            task = Task(key, manager.Event(), self._channel)
+        else:
+            task = Task(key, threading.Event(), self._channel)
+        future = TkFuture(self, func, args, kwargs, task)
+        self._futures[key] = future
+        for progressbar, futures, automatic in self._bindings:
+            if automatic and all(f.done() for f in futures):
+                futures.clear()
+            if automatic:
+                futures.append(future)
+                self._update_progressbar(progressbar, futures)
+        with self._lock:
+            if self._in_flight < self.max_in_flight:
+                self._start(future)
+            else:
+                self._waiting.append(future)
+        return future
+
+    def bind_progressbar(self, progressbar, futures=None):
+        """
+        Show the combined progress of futures in a determinate progressbar. Each future counts as one step of the
+        progressbar, divided by the progress the function reports.
+
+        :param progressbar: a ``ttk.Progressbar``, e.g. with the ``info.Horizontal.TProgressbar`` style
+        :param futures: the futures to show; by default, the futures submitted from now on. The progress starts over
+            when a future is submitted after all previous futures have finished.
+        """
+        binding = (progressbar, list(futures or ()), futures is None)
+        self._bindings.append(binding)
+        self._update_progressbar(progressbar, binding[1])
+
+    def unbind_progressbar(self, progressbar):
+        """
+        Stop showing progress in a progressbar
+        """
+        self._bindings = [binding for binding in self._bindings if binding[0] is not progressbar]
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Stop accepting functions and release the pool. Functions waiting in the executor are cancelled.
+
+        :param bool wait: wait for the running functions to finish; otherwise the pool, and the manager process of a
+            process pool, are released in the background when they finish.
+        :param bool cancel_futures: also ask the running functions to stop
+        """
+        with self._lock:
+            self._shutdown = True
+            waiting = list(self._waiting)
+            self._waiting.clear()
+        for future in waiting:
+            future._cancelled = True
+            self._post(self._deliver, future)
+        if cancel_futures:
+            for future in list(self._futures.values()):
+                future.cancel()
+        running = [future._future for future in self._futures.values() if future._future is not None]
+        self._pool.shutdown(wait)
+        if self._manager is not None:
+            if wait:
+                self._stop_manager(running)
+            else:
+                threading.Thread(target=self._stop_manager, args=(running,), name='TkExecutor manager').start()
+
+    def _start_manager(self):
+        """
+        Start the manager process that carries the progress and cancellation of process pool tasks
+        """
+        if self._manager is None:
+            import multiprocessing
+            self._manager = multiprocessing.Manager()
+            self._channel = self._manager.Queue()
+            self._listener = threading.Thread(target=self._listen, args=(self._channel,), daemon=True)
+            self._listener.start()
+        return self._manager
+
+    def _stop_manager(self, running):
+        """
+        Stop the manager process once the running functions have finished
+
+        :param running: the futures of the pool that the functions may still be running in
+        """
+        wait_futures(running)
+        self._channel.put(None)
+        self._listener.join()
+        self._manager.shutdown()
+        self._manager = None
+
+    def _listen(self, queue):
+        for item in iter(queue.get, None):
+            self._report(*item)
+
+    def _start(self, future):
+        """
+        Hand a future to the pool; called with the lock held
+        """
+        self._in_flight += 1
+        func, args, kwargs = future._call
+        future._future = self._pool.submit(_run_task, func, future.task, args, kwargs)
+        future._future.add_done_callback(lambda f: self._finished(future))
+
+    def _finished(self, future):
+        """
+        Start a waiting future and deliver the outcome; called from the worker thread
+        """
+        with self._lock:
+            self._in_flight -= 1
+            while self._waiting and not self._shutdown:
+                waiting = self._waiting.popleft()
+                if not waiting._cancelled:
+                    self._start(waiting)
+                    break
+        self._post(self._deliver, future)
+
+    def _cancel(self, future):
+        if future._delivered:
+            return False
+        with self._lock:
+            if future._future is None:
+                if future in self._waiting:
+                    self._waiting.remove(future)
+                    future._cancelled = True
+                    self._post(self._deliver, future)
+                return True
+        if not future._future.cancel():
+            future.task._event.set()
+        return True
+
+    def _report(self, key, value, maximum):
+        """
+        Record a progress report from any thread; reports are delivered once per batch of the dispatcher
+        """
+        with self._lock:
+            posted = key in self._progress
+            self._progress[key] = (value, maximum)
+        if not posted:
+            self._post(self._deliver_progress, key)
+
+    def _post(self, func, *args):
+        """
+        Run a function on the Tk thread; nothing is delivered once the dispatcher is closed, e.g. after the root
+        window was destroyed while functions were running.
+        """
+        try:
+            self.dispatcher.post(func, *args)
+        except RuntimeError:
+            # the dispatcher is closed
+            pass
+
+    def _deliver_progress(self, key):
+        with self._lock:
+            value, maximum = self._progress.pop(key)
+        future = self._futures.get(key)
+        if future is None:
+            return
+        future.value, future.maximum = value, maximum
+        self._update_progressbars(future)
+        for func in future._callbacks['progress']:
+            func(value, maximum)
+
+    def _deliver(self, future):
+        if future._delivered:
+            return
+        future._delivered = True
+        self._futures.pop(future.task.key, None)
+        self._update_progressbars(future)
+        future._call_callbacks()
+
+    def _update_progressbars(self, future):
+        for progressbar, futures, _ in self._bindings:
+            if future in futures:
+                self._update_progressbar(progressbar, futures)
+
+    @staticmethod
+    def _update_progressbar(progressbar, futures):
+        progressbar.configure(maximum=max(1, len(futures)), value=sum(future.fraction for future in futures))
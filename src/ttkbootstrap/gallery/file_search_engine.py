@@ -3,16 +3,20 @@
     Modified: 2021-04-07
     Adapted for ttkbootstrap from: https://github.com/israel-dryer/File-Search-Engine-Tk
 """
+import os
 import csv
+import time
 import datetime
 import pathlib
+import traceback
 import tkinter
-from queue import Queue
-from threading import Thread
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
 from tkinter import ttk
 from tkinter.filedialog import askdirectory, asksaveasfilename
 
 from ttkbootstrap import Style
+from ttkbootstrap.dispatch import Dispatcher
 
 
 class Application(tkinter.Tk):
@@ -33,6 +37,10 @@ class SearchEngine(ttk.Frame):
         self.search_term_var = tkinter.StringVar(value='txt')
         self.search_type_var = tkinter.StringVar(value='endswidth')
         self.search_count = 0
+        # the running search of each search node of the tree; the search threads deliver their results to the tk
+        # thread through the dispatcher
+        self.jobs = {}
+        self.dispatcher = Dispatcher.get(self)
 
         # container for user input
         input_labelframe = ttk.Labelframe(self, text='Complete the form to begin your search', padding=(20, 10, 10, 5))
@@ -88,6 +96,7 @@ class SearchEngine(ttk.Frame):
         self.menu = tkinter.Menu(self, tearoff=False)
         self.menu.add_command(label='Reveal in file manager', command=self.on_doubleclick_tree)
         self.menu.add_command(label='Export results to csv', command=self.export_to_csv)
+        self.menu.add_command(label='Cancel search', command=self.cancel_search)
 
         # event binding
         self.tree.bind('<Double-1>', self.on_doubleclick_tree)
@@ -117,9 +126,11 @@ class SearchEngine(ttk.Frame):
         if id.startswith('I'):
             self.menu.entryconfigure('Export results to csv', state='disabled')
             self.menu.entryconfigure('Reveal in file manager', state='normal')
+            self.menu.entryconfigure('Cancel search', state='disabled')
         else:
             self.menu.entryconfigure('Export results to csv', state='normal')
             self.menu.entryconfigure('Reveal in file manager', state='disabled')
+            self.menu.entryconfigure('Cancel search', state='normal' if id in self.jobs else 'disabled')
         self.menu.post(event.x_root, event.y_root)
 
     def on_search(self):
@@ -129,12 +140,34 @@ class SearchEngine(ttk.Frame):
         search_type = self.search_type_var.get()
         if search_term == '':
             return
-        Thread(target=SearchEngine.file_search, args=(search_term, search_path, search_type), daemon=True).start()
         self.progressbar.start(10)
         self.search_count += 1
         id = self.tree.insert('', 'end', self.search_count, text=f'Search {self.search_count}')
         self.tree.item(id, open=True)
-        self.check_queue(id)
+        post = self.dispatcher.post
+        self.jobs[id] = SearchJob(search_path, search_term, search_type,
+                                  found=lambda batch: post(self.insert_rows, batch, id),
+                                  finished=lambda: post(self.search_finished, id),
+                                  failed=lambda error: post(self.search_failed, id, error))
+
+    def cancel_search(self):
+        """Cancel the selected search"""
+        try:
+            id = self.tree.selection()[0]
+        except IndexError:
+            return
+        if id in self.jobs:
+            self.jobs[id].cancel()
+
+    def search_failed(self, id, error):
+        """Show the error of a failed search in its search node"""
+        self.tree.item(id, text=f'{self.tree.item(id, "text")} (failed: {error})')
+
+    def search_finished(self, id):
+        """Stop the progressbar when the last running search is finished"""
+        self.jobs.pop(id, None)
+        if not self.jobs:
+            self.progressbar.stop()
 
     def reveal_in_explorer(self, id):
         """Callback for double-click event on tree"""
@@ -163,85 +196,13 @@ class SearchEngine(ttk.Frame):
         # open file in explorer
         pathlib.os.startfile(filename)
 
-    def check_queue(self, id):
-        """Check file queue and print results if not empty"""
-        if searching and not file_queue.empty():
-            filename = file_queue.get()
-            self.insert_row(filename, id)
-            self.update_idletasks()
-            self.after(1, lambda: self.check_queue(id))
-        elif not searching and not file_queue.empty():
-            while not file_queue.empty():
-                filename = file_queue.get()
-                self.insert_row(filename, id)
-            self.update_idletasks()
-            self.progressbar.stop()
-        elif searching and file_queue.empty():
-            self.after(100, lambda: self.check_queue(id))
-        else:
-            self.progressbar.stop()
-
-    def insert_row(self, file, id):
-        """Insert new row in tree search results"""
-        try:
-            file_stats = file.stat()
-            file_name = file.stem
-            file_modified = datetime.datetime.fromtimestamp(file_stats.st_mtime).strftime('%m/%d/%Y %I:%M:%S%p')
-            file_type = file.suffix.lower()
-            file_size = SearchEngine.convert_size(file_stats.st_size)
-            file_path = file.absolute()
-            iid = self.tree.insert(id, 'end', text=file_name, values=(file_modified, file_type, file_size, file_path))
-            self.tree.selection_set(iid)
-            self.tree.see(iid)
-        except OSError:
-            return
-
-    @staticmethod
-    def file_search(term, search_path, search_type):
-        """Recursively search directory for matching files"""
-        SearchEngine.set_searching(1)
-        if search_type == 'contains':
-            SearchEngine.find_contains(term, search_path)
-        elif search_type == 'startswith':
-            SearchEngine.find_startswith(term, search_path)
-        elif search_type == 'endswith':
-            SearchEngine.find_endswith(term, search_path)
-
-    @staticmethod
-    def find_contains(term, search_path):
-        """Find all files that contain the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if term in file:
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
-
-    @staticmethod
-    def find_startswith(term, search_path):
-        """Find all files that start with the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if file.startswith(term):
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
-
-    @staticmethod
-    def find_endswith(term, search_path):
-        """Find all files that end with the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if file.endswith(term):
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
-
-    @staticmethod
-    def set_searching(state=False):
-        """Set searching status"""
-        global searching
-        searching = state
+    def insert_rows(self, batch, id):
+        """Insert a batch of search results in the tree; the view follows the last result of the batch"""
+        insert = self.tree.insert
+        for file_name, values in batch:
+            iid = insert(id, 'end', text=file_name, values=values)
+        self.tree.selection_set(iid)
+        self.tree.see(iid)
 
     @staticmethod
     def convert_size(size):
@@ -254,7 +215,132 @@ class SearchEngine(ttk.Frame):
             return f'{kb:,d} KB'
 
 
+class SearchJob:
+    """
+    A search for file names, walking the directory tree with a pool of threads. Each thread lists directories with
+    `os.scandir` and queues the subdirectories it finds for the pool, so directories are read in parallel. Matches
+    are delivered in batches of ready-to-insert results; see `result`.
+    """
+    matchers = {
+        'contains': lambda name, term: term in name,
+        'startswith': str.startswith,
+        'endswith': str.endswith}
+
+    def __init__(self, search_path, term, search_type, found, finished, failed=None, workers=8, batch_size=500,
+                 interval=0.1):
+        """
+        :param search_path: the directory to search
+        :param term: the search term
+        :param search_type: how file names are matched: contains, startswith or endswith
+        :param found: called from the search threads with each batch of matches
+        :param finished: called from a search thread when the search is finished, cancelled or failed
+        :param failed: called from a search thread with an unexpected error, which cancels the search; the error is
+            printed by default
+        :param workers: the number of directory walking threads
+        :param batch_size: the maximum number of matches per batch
+        :param interval: the maximum number of seconds a match waits for its batch to fill up
+        """
+        self.term = term
+        self.match = SearchJob.matchers[search_type]
+        self.found = found
+        self.finished = finished
+        self.failed = failed or (lambda error: traceback.print_exception(type(error), error, error.__traceback__))
+        self.batch_size = batch_size
+        self.interval = interval
+        self.cancelled = Event()
+        self.directories = Queue()
+        self.directories.put(os.path.abspath(search_path))
+        self.lock = Lock()
+        self.running = workers
+        for _ in range(workers):
+            Thread(target=self.walk, daemon=True).start()
+        Thread(target=self.wait, daemon=True).start()
+
+    def cancel(self):
+        """Stop the search; matches that were found already may still be delivered"""
+        self.cancelled.set()
+
+    def wait(self):
+        """Stop the walking threads when every directory is read"""
+        self.directories.join()
+        for _ in range(self.running):
+            self.directories.put(None)
+
+    @staticmethod
+    def result(entry):
+        """
+        The tree row of a matching file: the name, and the modified date, type, size and path values. The row is
+        formatted in the search thread, so the tk thread only inserts it.
+        """
+        file_stats = entry.stat()
+        file_name, file_type = os.path.splitext(entry.name)
+        try:
+            file_modified = datetime.datetime.fromtimestamp(file_stats.st_mtime).strftime('%m/%d/%Y %I:%M:%S%p')
+        except (OverflowError, ValueError, OSError):
+            # a timestamp outside of the range of the platform's time functions
+            file_modified = ''
+        file_size = SearchEngine.convert_size(file_stats.st_size)
+        return file_name, (file_modified, file_type.lower(), file_size, entry.path)
+
+    def walk(self):
+        """Read directories from the queue until the search is finished"""
+        batch = []
+        # the time by which the first match of the batch is delivered
+        due = 0
+        try:
+            while True:
+                try:
+                    # a partial batch is delivered while waiting for the next directory
+                    directory = self.directories.get(timeout=max(0, due - time.monotonic()) if batch else None)
+                except Empty:
+                    self.found(batch)
+                    batch = []
+                    continue
+                if directory is None:
+                    break
+                try:
+                    if not self.cancelled.is_set():
+                        with os.scandir(directory) as entries:
+                            for entry in entries:
+                                try:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        self.directories.put(entry.path)
+                                    elif self.match(entry.name, self.term) and entry.is_file():
+                                        if not batch:
+                                            due = time.monotonic() + self.interval
+                                        batch.append(self.result(entry))
+                                except OSError:
+                                    continue
+                                if batch and (len(batch) >= self.batch_size or time.monotonic() >= due):
+                                    self.found(batch)
+                                    batch = []
+                except OSError:
+                    pass
+                except Exception as error:
+                    # stop the search, but keep taking directories from the queue so that every thread finishes
+                    batch = []
+                    self.fail(error)
+                finally:
+                    self.directories.task_done()
+            if batch and not self.cancelled.is_set():
+                self.found(batch)
+        except Exception as error:
+            self.fail(error)
+        finally:
+            with self.lock:
+                self.running -= 1
+                last = not self.running
+            if last:
+                self.finished()
+
+    def fail(self, error):
+        """Cancel the search because of an unexpected error, and report the error"""
+        self.cancel()
+        try:
+            self.failed(error)
+        except Exception:
+            traceback.print_exc()
+
+
 if __name__ == '__main__':
-    file_queue = Queue()
-    searching = False
     Application().mainloop()
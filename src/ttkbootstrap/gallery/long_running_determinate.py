@@ -1,11 +1,10 @@
 import tkinter
-from queue import Queue
 from random import randint
-from threading import Thread
 from time import sleep
 from tkinter import ttk
 from tkinter.messagebox import showinfo
 from ttkbootstrap import Style
+from ttkbootstrap.executor import TkExecutor, current_task
 
 
 class Application(tkinter.Tk):
@@ -26,7 +25,7 @@ class LongRunning(ttk.Frame):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.configure(padding=20)
-        self.task_queue = Queue()
+        self.tasks_remaining = 0
 
         # instructions
         lbl = ttk.Label(self, text="Click the START button to begin a \n"
@@ -42,30 +41,41 @@ class LongRunning(ttk.Frame):
         self.progressbar = ttk.Progressbar(self, maximum=10, style='info.Horizontal.TProgressbar')
         self.progressbar.pack(fill='x')
 
-    def simulated_blocking_io_task(self, thread_num):
-        """A simulated IO operation to run for a random time interval between 5 and 10 seconds"""
+        # the tasks run in a thread pool; their progress is shown in the progressbar as it is reported
+        self.executor = TkExecutor(self, max_workers=10)
+        self.executor.bind_progressbar(self.progressbar)
+        # stop the tasks when the window is closed, so that the application can exit
+        self.bind('<Destroy>', self.on_destroy, '+')
+
+    def on_destroy(self, event):
+        if event.widget is self:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def simulated_blocking_io_task(thread_num):
+        """A simulated IO operation to run for a random time interval between 5 and 15 seconds"""
+        task = current_task()
         seconds_to_run = randint(5, 15)
-        sleep(seconds_to_run)
-        self.task_queue.task_done()
-        print('Finished task on Thread:', thread_num)
+        for second in range(seconds_to_run):
+            task.check()
+            sleep(1)
+            task.report(second + 1, seconds_to_run)
+        return thread_num
 
     def start_task(self):
-        """Start the progressbar and run the task in another thread"""
+        """Run the tasks in the thread pool"""
         self.btn.configure(state='disabled')
+        self.tasks_remaining = 10
         for i in range(1, 11):
-            self.task_queue.put(Thread(target=self.simulated_blocking_io_task, args=[i], daemon=True).start())
-        self.listen_for_complete_task()
+            self.executor.submit(self.simulated_blocking_io_task, i).on_done(self.task_complete)
 
-    def listen_for_complete_task(self):
-        """Check to see if task is complete; if so, stop the progressbar and show and alert"""
-        if self.task_queue.unfinished_tasks == 0:
-            self.progressbar.configure(value=10)
+    def task_complete(self, thread_num):
+        """Called on the tk thread when a task is complete; shows an alert when all tasks are complete"""
+        print('Finished task on Thread:', thread_num)
+        self.tasks_remaining -= 1
+        if self.tasks_remaining == 0:
             showinfo(title='alert', message="process complete")
             self.btn.configure(state='normal')
-            return
-        tasks_completed = self.progressbar['maximum'] - self.task_queue.unfinished_tasks
-        self.progressbar.configure(value=tasks_completed)
-        self.after(500, self.listen_for_complete_task)
 
 
 if __name__ == '__main__':
@@ -33,6 +33,7 @@ class CreatorDesignWindow(tk.Toplevel):
         self.theme_name = self.master.style.theme_use()
         self.fallback_colors = deepcopy(self.style.colors)
         self.geometry_set = False
+        self.new_style = None
         self.bind("<Insert>", self.get_bounding_box)
 
         # setup application window
@@ -291,8 +292,11 @@ class CreatorDesignWindow(tk.Toplevel):
                 colors=colors)
 
             # attach the new theme to the style so that it is not garbage collected!!
-            self.new_style = StylerTTK(self.style, definition)
+            old_style, self.new_style = self.new_style, StylerTTK(self.style, definition)
             self.style.theme_use(themename=theme_id)
+            # the previous theme is no longer used; its images are deleted unless the new theme shares them
+            if old_style is not None:
+                old_style.release_images()
         except Exception:
             return
 
@@ -0,0 +1,28 @@
+import gc
+import sys
+import tkinter
+from pathlib import Path
+
+import pytest
+
+# the tests run against the source tree, like the gallery and the benchmarks
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+
+@pytest.fixture
+def master():
+    """
+    A Tcl interpreter without Tk, so no display is needed. The exceptions of its callbacks are collected in
+    ``master.errors``.
+    """
+    from ttkbootstrap.dispatch import Dispatcher
+    master = tkinter.Tcl()
+    errors = master.errors = []
+    master.report_callback_exception = lambda exc, value, tb: errors.append(value)
+    yield master
+    dispatcher = Dispatcher._interps.get(master.tk)
+    if dispatcher is not None:
+        dispatcher.close()
+    del master
+    # Tcl aborts when an interpreter is deleted by another thread, e.g. by a garbage collection in a worker thread
+    gc.collect()
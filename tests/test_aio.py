@@ -0,0 +1,217 @@
+import time
+import socket
+import asyncio
+import tkinter
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ttkbootstrap.aio import PollingTkSelector, TkEventLoop, TkSelector, run, wait_event
+
+# ``bind`` and ``event generate`` need Tk; these procedures keep bindings the same way for a Tcl interpreter
+BIND_SCRIPT = """
+proc bind {w sequence args} {
+    global bindings
+    if {![llength $args]} {
+        if {[info exists bindings($w,$sequence)]} {return $bindings($w,$sequence)}
+        return {}
+    }
+    set script [lindex $args 0]
+    if {[string index $script 0] eq "+"} {
+        set script [string range $script 1 end]
+        if {[info exists bindings($w,$sequence)] && $bindings($w,$sequence) ne {}} {
+            set script "$bindings($w,$sequence)\n$script"
+        }
+    }
+    set bindings($w,$sequence) $script
+}
+proc generate {w sequence} {
+    uplevel #0 [string map [list %W $w] [bind $w $sequence]]
+}
+"""
+
+
+class Widget:
+    """
+    The part of a widget that ``wait_event`` uses, on a Tcl interpreter without Tk
+    """
+    _w = '.widget'
+
+    def __init__(self, master):
+        self.master = master
+        self.tk = master.tk
+        self.tk.eval(BIND_SCRIPT)
+
+    def bind(self, sequence, func, add=None):
+        funcid = self.master.register(func)
+        self.tk.call('bind', self._w, sequence, f"{'+' if add else ''}{funcid} %W")
+        return funcid
+
+    def deletecommand(self, name):
+        self.master.deletecommand(name)
+
+    def generate(self, sequence):
+        self.tk.call('generate', self._w, sequence)
+
+
+class NoFileHandlers:
+    """
+    An interpreter as on platforms without Tk file handlers
+    """
+
+    def __init__(self, tk):
+        self._tk = tk
+
+    def dooneevent(self, flags=0):
+        return self._tk.dooneevent(flags)
+
+
+@pytest.fixture(params=['file handlers', 'polling'])
+def loop_master(request, master):
+    if request.param == 'polling':
+        return SimpleNamespace(tk=NoFileHandlers(master.tk), tcl=master)
+    return SimpleNamespace(tk=master.tk, tcl=master)
+
+
+def test_selector_type(master):
+    loop = TkEventLoop(master)
+    try:
+        assert isinstance(loop._selector, TkSelector)
+    finally:
+        loop.close()
+    loop = TkEventLoop(SimpleNamespace(tk=NoFileHandlers(master.tk)))
+    try:
+        assert isinstance(loop._selector, PollingTkSelector)
+    finally:
+        loop.close()
+
+
+def test_run_returns_the_result(loop_master):
+    async def main():
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    assert run(main(), loop_master) == 'result'
+
+
+def test_sleep_does_not_poll(master):
+    async def main():
+        start = time.process_time()
+        await asyncio.sleep(0.3)
+        return time.process_time() - start
+
+    assert run(main(), master) < 0.1
+
+
+def test_tcl_callbacks_run_while_asyncio_waits(loop_master):
+    async def main():
+        future = asyncio.get_running_loop().create_future()
+        loop_master.tcl.after(20, lambda: future.set_result('after'))
+        return await asyncio.wait_for(future, 5)
+
+    assert run(main(), loop_master) == 'after'
+
+
+def test_call_soon_threadsafe_wakes_the_loop(loop_master):
+    async def main():
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        threading.Timer(0.05, loop.call_soon_threadsafe, (future.set_result, 'thread')).start()
+        start = time.monotonic()
+        result = await asyncio.wait_for(future, 5)
+        return result, time.monotonic() - start
+
+    result, seconds = run(main(), loop_master)
+    assert result == 'thread'
+    assert seconds < 1
+
+
+def test_socket_reads(loop_master):
+    async def main():
+        loop = asyncio.get_running_loop()
+        ours, theirs = socket.socketpair()
+        with ours, theirs:
+            ours.setblocking(False)
+            threading.Timer(0.05, theirs.sendall, (b'ping',)).start()
+            return await asyncio.wait_for(loop.sock_recv(ours, 4), 5)
+
+    assert run(main(), loop_master) == b'ping'
+
+
+def test_streams(master):
+    async def main():
+        ours, theirs = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=ours)
+        try:
+            theirs.sendall(b'line\n')
+            line = await asyncio.wait_for(reader.readline(), 5)
+            writer.write(b'reply')
+            await writer.drain()
+            return line, theirs.recv(5)
+        finally:
+            writer.close()
+            theirs.close()
+
+    assert run(main(), master) == (b'line\n', b'reply')
+
+
+def test_selector_timeout(master):
+    selector = TkSelector(master.tk)
+    start = time.monotonic()
+    assert selector.select(0.05) == []
+    assert 0.04 <= time.monotonic() - start < 1
+    assert selector.select(0) == []
+
+
+def test_polling_selector_waits_until_the_timeout(master):
+    selector = PollingTkSelector(NoFileHandlers(master.tk), poll_interval=0.01)
+    try:
+        start = time.monotonic()
+        assert selector.select(0.1) == []
+        assert 0.09 <= time.monotonic() - start < 1
+        # Tcl events are processed between the slices
+        calls = []
+        master.after(20, lambda: calls.append(True))
+        selector.select(0.1)
+        assert calls == [True]
+    finally:
+        selector.close()
+
+
+def test_wait_event(master):
+    widget = Widget(master)
+    kept = []
+    widget.bind('<<ThemeChanged>>', kept.append, '+')
+    commands = set(master.tk.splitlist(master.tk.call('info', 'commands')))
+
+    async def main():
+        task = asyncio.ensure_future(wait_event(widget, '<<ThemeChanged>>'))
+        await asyncio.sleep(0.01)
+        widget.generate('<<ThemeChanged>>')
+        return await asyncio.wait_for(task, 5)
+
+    assert run(main(), master) == widget._w
+    # the other binding of the sequence is kept, the binding of wait_event and its command are removed
+    script = master.tk.call('bind', widget._w, '<<ThemeChanged>>')
+    assert len(script.split('\n')) == 1
+    widget.generate('<<ThemeChanged>>')
+    assert kept == [widget._w, widget._w]
+    assert set(master.tk.splitlist(master.tk.call('info', 'commands'))) == commands
+
+
+def test_wait_event_cleanup_on_cancel(master):
+    widget = Widget(master)
+    commands = set(master.tk.splitlist(master.tk.call('info', 'commands')))
+
+    async def main():
+        task = asyncio.ensure_future(wait_event(widget, '<<ThemeChanged>>'))
+        await asyncio.sleep(0.01)
+        assert master.tk.call('bind', widget._w, '<<ThemeChanged>>')
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(main(), master)
+    assert master.tk.call('bind', widget._w, '<<ThemeChanged>>') == ''
+    assert set(master.tk.splitlist(master.tk.call('info', 'commands'))) == commands
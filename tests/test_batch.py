@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from ttkbootstrap import Colors, _hex_to_int_rgb
+
+np = pytest.importorskip('numpy')
+from ttkbootstrap.batch import LABELS, derive_shades, palette_array  # noqa: E402
+
+PCT_CHANGES = (-0.2, -0.1, -0.05, 0.15, 1.5)
+
+
+def random_palettes(count, seed=0):
+    rng = random.Random(seed)
+    palettes = [Colors(**{label: '#%06x' % rng.randrange(0x1000000) for label in LABELS}) for _ in range(count)]
+    # the edge cases of the value scaling: black, white, saturated, rounding and short colors
+    palettes.append(Colors(primary='#000000', secondary='#ffffff', success='#ff0000', info='#00ff01', warning='#fff',
+                           danger='#010101', bg='#7f7f80', fg='#000', selectbg='#0000ff', selectfg='#fe0000',
+                           light='#808080', border='#ff8000', inputfg='#123'))
+    return palettes
+
+
+def test_palette_array():
+    palettes = random_palettes(5)
+    rgb = palette_array(palettes)
+    assert rgb.shape == (6, 13, 3)
+    for palette, row in zip(palettes, rgb.tolist()):
+        assert row == [list(_hex_to_int_rgb(palette.get(label))) for label in LABELS]
+
+
+def test_palette_array_of_hex_sequences():
+    palettes = random_palettes(3)
+    sequences = [[palette.get(label) for label in LABELS] for palette in palettes]
+    assert (palette_array(sequences) == palette_array(palettes)).all()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_derive_shades_matches_colors_derive(seed):
+    palettes = random_palettes(200, seed)
+    for palette, shades in zip(palettes, derive_shades(palettes, PCT_CHANGES)):
+        assert shades == palette.derive(PCT_CHANGES)
+
+
+def test_derive_shades_matches_colors_brightness():
+    palettes = random_palettes(50)
+    for palette, shades in zip(palettes, derive_shades(palettes)):
+        for label in LABELS:
+            for pct in (-0.2, -0.1, -0.05):
+                assert shades[label][pct] == Colors.brightness(palette.get(label), pct)
+
+
+def test_derive_shades_input_formats():
+    palettes = random_palettes(10)
+    expected = derive_shades(palettes)
+    assert derive_shades(palette_array(palettes)) == expected
+    assert derive_shades(np.array([[palette.get(label) for label in LABELS] for palette in palettes])) == expected
@@ -0,0 +1,68 @@
+import random
+import colorsys
+
+import pytest
+
+from ttkbootstrap import Colors, _brightness, _hex_to_int_rgb
+
+
+def hsv_brightness(hex_color, pct_change):
+    """
+    The brightness change computed in the HSV color space, without rounding the intermediate values
+    """
+    r, g, b = (channel / 255 for channel in _hex_to_int_rgb(hex_color))
+    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    return tuple(channel * 255 for channel in colorsys.hsv_to_rgb(h, s, min(1, max(0, (1 + pct_change) * v))))
+
+
+@pytest.mark.parametrize('color, expected', [
+    ('#000000', (0, 0, 0)),
+    ('#ffffff', (255, 255, 255)),
+    ('#1a2B3c', (0x1a, 0x2b, 0x3c)),
+    ('#fff', (255, 255, 255)),
+    ('#123', (0x11, 0x22, 0x33))])
+def test_hex_to_int_rgb(color, expected):
+    assert _hex_to_int_rgb(color) == expected
+
+
+def test_hex_rgb_round_trip():
+    rng = random.Random(0)
+    for _ in range(1000):
+        color = '#%06x' % rng.randrange(0x1000000)
+        assert Colors.rgb_to_hex(*Colors.hex_to_rgb(color)) == color
+
+
+@pytest.mark.parametrize('pct_change', [-1, -0.2, -0.1, -0.05, 0, 0.15, 0.5, 2])
+def test_brightness_matches_hsv(pct_change):
+    rng = random.Random(pct_change)
+    for _ in range(2000):
+        color = '#%06x' % rng.randrange(0x1000000)
+        result = _hex_to_int_rgb(Colors.brightness(color, pct_change))
+        # the integer path rounds once, at the end
+        assert all(abs(channel - exact) <= 0.5 + 1e-9
+                   for channel, exact in zip(result, hsv_brightness(color, pct_change))), color
+
+
+def test_brightness_limits():
+    assert Colors.brightness('#000000', 0.5) == '#000000'
+    assert Colors.brightness('#808080', -1) == '#000000'
+    assert Colors.brightness('#808080', 1) == '#ffffff'
+    assert Colors.brightness('#ff8000', 0.5) == '#ff8000'
+    assert Colors.brightness('#fff', -0.2) == '#cccccc'
+    assert Colors.brightness('#ffffff', 0) == '#ffffff'
+
+
+def test_brightness_is_memoized():
+    _brightness.cache_clear()
+    Colors.brightness('#336699', -0.1)
+    Colors.brightness('#336699', -0.1)
+    info = _brightness.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_derive():
+    colors = Colors(primary='#336699', bg='#fff', fg='#000000')
+    shades = colors.derive((-0.2, 0.1))
+    assert list(shades) == list(Colors.label_iter())
+    for label in Colors.label_iter():
+        assert shades[label] == {pct: Colors.brightness(colors.get(label), pct) for pct in (-0.2, 0.1)}
@@ -0,0 +1,71 @@
+import pytest
+
+from ttkbootstrap import compiler
+
+
+class HiddenRoot:
+    """
+    Stands in for the hidden window of ``compile_themes``, which needs a display
+    """
+    instances = []
+
+    def __init__(self):
+        self.withdrawn = self.destroyed = False
+        self.instances.append(self)
+
+    def withdraw(self):
+        self.withdrawn = True
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FailingStyle:
+    def __init__(self, **kwargs):
+        raise ValueError('no theme')
+
+
+@pytest.fixture
+def hidden_root(monkeypatch):
+    HiddenRoot.instances.clear()
+    monkeypatch.setattr(compiler.tkinter, 'Tk', HiddenRoot)
+    monkeypatch.setattr(compiler, 'Style', FailingStyle)
+    return HiddenRoot.instances
+
+
+def test_the_hidden_window_is_destroyed_on_failure(tmp_path, hidden_root):
+    with pytest.raises(ValueError):
+        compiler.compile_themes(tmp_path / 'bundle')
+    [root] = hidden_root
+    assert root.withdrawn and root.destroyed
+    assert (tmp_path / 'bundle' / 'images').is_dir()
+
+
+def test_a_master_is_not_destroyed(tmp_path, hidden_root):
+    master = HiddenRoot()
+    with pytest.raises(ValueError):
+        compiler.compile_themes(tmp_path, master=master)
+    assert hidden_root == [master]
+    assert not master.withdrawn and not master.destroyed
+
+
+def test_main(monkeypatch, capsys):
+    calls = []
+
+    def compile_themes(*args):
+        calls.append(args)
+        return {'themes': [{'name': 'flatly'}, {'name': 'darkly'}]}
+
+    monkeypatch.setattr(compiler, 'compile_themes', compile_themes)
+    compiler.main(['build/themes', '--theme', 'flatly', '--theme', 'darkly', '--family', 'TButton',
+                   '--variant', 'primary'])
+    compiler.main(['build/themes'])
+    assert calls == [('build/themes', ['flatly', 'darkly'], ['TButton'], ['primary']),
+                     ('build/themes', None, None, None)]
+    assert capsys.readouterr().out.splitlines() == ['compiled 2 themes to build/themes'] * 2
+
+
+def test_main_requires_a_path(capsys):
+    with pytest.raises(SystemExit):
+        compiler.main([])
+    assert 'path' in capsys.readouterr().err
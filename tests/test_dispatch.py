@@ -0,0 +1,106 @@
+import time
+import tkinter
+import threading
+
+import pytest
+
+from ttkbootstrap.dispatch import Dispatcher
+
+
+def process_events(master, condition=None, timeout=5):
+    """
+    Process Tk events until the condition is true, or until no events are pending when there is no condition
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition is not None and condition():
+            return
+        if not master.tk.dooneevent(tkinter._tkinter.DONT_WAIT):
+            if condition is None:
+                return
+            time.sleep(0.001)
+
+
+def test_get_returns_one_dispatcher_per_interpreter(master):
+    dispatcher = Dispatcher.get(master)
+    assert Dispatcher.get(master) is dispatcher
+    other = tkinter.Tcl()
+    try:
+        assert Dispatcher.get(other) is not dispatcher
+    finally:
+        Dispatcher.get(other).close()
+
+
+def test_callbacks_run_in_order_on_the_tk_thread(master):
+    dispatcher = Dispatcher.get(master)
+    calls = []
+    for i in range(100):
+        dispatcher.post(lambda i=i: calls.append((i, threading.get_ident())))
+    assert calls == []
+    process_events(master, lambda: len(calls) == 100)
+    assert calls == [(i, threading.get_ident()) for i in range(100)]
+
+
+def test_callbacks_posted_from_threads_keep_their_order(master):
+    dispatcher = Dispatcher.get(master)
+    calls = []
+
+    def worker(k):
+        for i in range(2000):
+            dispatcher.post(calls.append, (k, i))
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    process_events(master, lambda: len(calls) == 8000)
+    for thread in threads:
+        thread.join()
+    for k in range(4):
+        assert [i for kk, i in calls if kk == k] == list(range(2000))
+
+
+def test_arguments(master):
+    dispatcher = Dispatcher.get(master)
+    calls = []
+    dispatcher.post(lambda *args, **kwargs: calls.append((args, kwargs)), 1, 2, key='value')
+    process_events(master, lambda: calls)
+    assert calls == [((1, 2), {'key': 'value'})]
+
+
+def test_drain_stops_at_the_budget(master):
+    dispatcher = Dispatcher(master, budget=5)
+    try:
+        for _ in range(100):
+            dispatcher.post(time.sleep, 0.001)
+        count = dispatcher.drain()
+        assert 1 <= count < 100
+        assert dispatcher.pending() == 100 - count
+        # the rest runs in later batches, after the pending events
+        process_events(master, lambda: not dispatcher.pending())
+        assert dispatcher.pending() == 0
+        assert dispatcher.drain(budget=0) == 0
+    finally:
+        dispatcher.close()
+
+
+def test_errors_are_reported_and_do_not_stop_the_queue(master):
+    dispatcher = Dispatcher.get(master)
+    calls = []
+    dispatcher.post(lambda: 1 / 0)
+    dispatcher.post(calls.append, 'after the error')
+    process_events(master, lambda: calls)
+    assert calls == ['after the error']
+    assert [type(error) for error in master.errors] == [ZeroDivisionError]
+
+
+def test_close(master):
+    dispatcher = Dispatcher.get(master)
+    calls = []
+    dispatcher.post(calls.append, 'discarded')
+    dispatcher.close()
+    assert Dispatcher.get(master) is not dispatcher
+    with pytest.raises(RuntimeError):
+        dispatcher.post(calls.append, 'rejected')
+    process_events(master)
+    assert calls == []
+    dispatcher.close()
@@ -0,0 +1,161 @@
+import time
+import tkinter
+import threading
+
+import pytest
+
+from ttkbootstrap.executor import CancelledError, TkExecutor, current_task
+
+
+class Progressbar:
+    def __init__(self):
+        self.options = {}
+
+    def configure(self, **kw):
+        self.options.update(kw)
+
+
+def square(n, steps=4, delay=0.0):
+    task = current_task()
+    for i in range(steps):
+        task.check()
+        time.sleep(delay)
+        task.report(i + 1, steps)
+    if n < 0:
+        raise ValueError(n)
+    return n * n
+
+
+def process_events(master, condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        if not master.tk.dooneevent(tkinter._tkinter.DONT_WAIT):
+            time.sleep(0.001)
+
+
+def test_current_task_outside_of_the_executor():
+    assert current_task() is None
+
+
+def test_results_and_errors_are_delivered_on_the_tk_thread(master):
+    with TkExecutor(master, max_workers=2) as executor:
+        calls = []
+        done = executor.submit(square, 3).on_done(lambda result: calls.append(('done', result, threading.get_ident())))
+        failed = executor.submit(square, -1).on_error(lambda error: calls.append(('error', error.args, None)))
+        process_events(master, lambda: done.done() and failed.done())
+    assert sorted(calls, key=str) == [('done', 9, threading.get_ident()), ('error', (-1,), None)]
+    assert done.result() == 9
+    assert isinstance(failed.exception(), ValueError)
+    assert master.errors == []
+
+
+def test_errors_without_callbacks_are_reported(master):
+    with TkExecutor(master) as executor:
+        future = executor.submit(square, -2)
+        process_events(master, future.done)
+    assert [error.args for error in master.errors] == [(-2,)]
+
+
+def test_callbacks_added_after_the_future_is_done(master):
+    with TkExecutor(master) as executor:
+        future = executor.submit(square, 2)
+        process_events(master, future.done)
+        calls = []
+        future.on_done(calls.append).on_error(calls.append).on_cancel(lambda: calls.append('cancelled'))
+        process_events(master, lambda: calls)
+        time.sleep(0.01)
+        master.tk.dooneevent(tkinter._tkinter.DONT_WAIT)
+    assert calls == [4]
+
+
+def test_progress(master):
+    with TkExecutor(master) as executor:
+        progressbar = Progressbar()
+        executor.bind_progressbar(progressbar)
+        reports = []
+        futures = [executor.submit(square, n, 5).on_progress(lambda value, maximum: reports.append((value, maximum)))
+                   for n in range(3)]
+        assert progressbar.options == {'maximum': 3, 'value': 0.0}
+        process_events(master, lambda: all(future.done() for future in futures))
+    # reports are coalesced, but the last report of each future is delivered
+    assert 3 <= len(reports) <= 15
+    assert reports.count((5, 5)) == 3
+    assert all(future.fraction == 1.0 for future in futures)
+    assert progressbar.options == {'maximum': 3, 'value': 3.0}
+
+
+def test_max_in_flight_and_cancelling_a_waiting_future(master):
+    with TkExecutor(master, max_workers=1, max_in_flight=2) as executor:
+        cancelled = []
+        futures = [executor.submit(square, n, 10, 0.005).on_cancel(lambda n=n: cancelled.append(n)) for n in range(4)]
+        assert executor._in_flight == 2 and len(executor._waiting) == 2
+        assert futures[3].cancel()
+        process_events(master, lambda: all(future.done() for future in futures))
+    assert cancelled == [3]
+    assert futures[3].cancelled()
+    with pytest.raises(CancelledError):
+        futures[3].result()
+    assert [future.result() for future in futures[:3]] == [0, 1, 4]
+    assert not futures[0].cancel()
+
+
+def test_cancelling_a_running_future(master):
+    with TkExecutor(master, max_workers=1) as executor:
+        cancelled = []
+        future = executor.submit(square, 5, 1000, 0.001).on_cancel(lambda: cancelled.append(True))
+        process_events(master, lambda: future.value > 2)
+        assert future.cancel()
+        process_events(master, future.done)
+    assert cancelled == [True]
+    assert future.cancelled()
+    assert master.errors == []
+
+
+def test_shutdown(master):
+    executor = TkExecutor(master, max_workers=1, max_in_flight=1)
+    running = executor.submit(square, 1, 5, 0.005)
+    waiting = executor.submit(square, 2)
+    executor.shutdown()
+    process_events(master, lambda: running.done() and waiting.done())
+    assert running.result() == 1
+    assert waiting.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(square, 3)
+
+
+def test_process_pool(master):
+    with TkExecutor(master, max_workers=2, processes=True) as executor:
+        futures = [executor.submit(square, n) for n in range(4)]
+        process_events(master, lambda: all(future.done() for future in futures), timeout=30)
+    assert [future.result() for future in futures] == [0, 1, 4, 9]
+
+
+def test_max_workers(master):
+    with TkExecutor(master) as executor:
+        assert executor.max_workers >= 1
+        assert executor.max_in_flight == 2 * executor.max_workers
+    with TkExecutor(master, max_workers=3) as executor:
+        assert (executor.max_workers, executor.max_in_flight) == (3, 6)
+
+
+def test_nothing_is_delivered_after_the_dispatcher_is_closed(master):
+    executor = TkExecutor(master, max_workers=1, max_in_flight=1)
+    running = executor.submit(square, 1, 1000, 0.001)
+    waiting = executor.submit(square, 2)
+    process_events(master, lambda: running.value > 0)
+    executor.dispatcher.close()
+    # the workers report progress and finish without errors
+    executor.shutdown(wait=True, cancel_futures=True)
+    assert running._future.done() and not running.done()
+    assert not waiting.done()
+
+
+def test_shutdown_without_waiting_stops_the_manager(master):
+    executor = TkExecutor(master, max_workers=1, processes=True)
+    future = executor.submit(square, 2, 50, 0.01)
+    manager = executor._manager
+    executor.shutdown(wait=False, cancel_futures=True)
+    process_events(master, lambda: future.done() and executor._manager is None, timeout=30)
+    assert future.cancelled()
+    assert not manager._process.is_alive()
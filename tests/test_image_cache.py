@@ -0,0 +1,62 @@
+import tkinter
+
+import pytest
+
+from ttkbootstrap import ImageCache
+
+
+class Image:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+@pytest.fixture
+def rendered(monkeypatch, master):
+    # images are not drawn, so the cache works with a Tcl interpreter without Tk
+    rendered = []
+    monkeypatch.setattr(ImageCache, '_render', staticmethod(
+        lambda master, name, shape, color, size: rendered.append((shape, color, size)) or Image(name)))
+    yield rendered
+    ImageCache._interps.pop(master.tk, None)
+
+
+def test_image_name():
+    assert ImageCache.image_name('circle', '#ff0000', 16) == 'ttkbootstrap_circle__ff0000_16_1'
+    assert ImageCache.image_name('square', '#ff0000', 16, 1.5) != ImageCache.image_name('square', '#ff0000', 16, 2)
+
+
+def test_acquire_shares_images(master, rendered):
+    first = ImageCache.acquire(master, 'circle', '#ff0000', 16)
+    assert ImageCache.acquire(master, 'circle', '#ff0000', 16) is first
+    assert ImageCache.acquire(master, 'circle', '#00ff00', 16) is not first
+    assert ImageCache.acquire(master, 'circle', '#ff0000', 16, scale=2) is not first
+    assert rendered == [('circle', '#ff0000', 16), ('circle', '#00ff00', 16), ('circle', '#ff0000', 32)]
+    assert ImageCache.count(master) == 3
+
+
+def test_images_are_kept_per_interpreter(master, rendered):
+    other = tkinter.Tcl()
+    try:
+        image = ImageCache.acquire(master, 'square', '#ff0000', 16)
+        assert ImageCache.acquire(other, 'square', '#ff0000', 16) is not image
+        assert ImageCache.count(master) == ImageCache.count(other) == 1
+    finally:
+        ImageCache._interps.pop(other.tk, None)
+
+
+def test_release_deletes_unused_images(master, rendered):
+    image = ImageCache.acquire(master, 'circle', '#ff0000', 16)
+    ImageCache.acquire(master, 'circle', '#ff0000', 16)
+    kept = ImageCache.acquire(master, 'square', '#ff0000', 16)
+    ImageCache.release(master, image)
+    assert ImageCache.count(master) == 2
+    ImageCache.release(master, image)
+    assert ImageCache.count(master) == 1
+    # releasing an image that is not cached is ignored
+    ImageCache.release(master, image)
+    ImageCache.release(master, kept)
+    assert ImageCache.count(master) == 0
+    assert master.tk not in ImageCache._interps
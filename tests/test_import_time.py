@@ -0,0 +1,23 @@
+"""
+Import time check, run in fresh interpreters; ``benchmarks/import_time.py`` reports the details.
+"""
+import sys
+from pathlib import Path
+
+# the measurement is shared with the benchmark
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from import_time import deferred_imports, import_times, imported_modules  # noqa: E402
+
+# generous, so that the check does not fail on slow or busy machines; the import takes a few milliseconds
+MAX_MS = 500
+
+
+def test_deferred_modules_are_not_imported():
+    assert deferred_imports(imported_modules(import_times())) == []
+
+
+def test_import_time():
+    # the fastest of a few runs, which is the least affected by other processes
+    milliseconds = min(import_times()['ttkbootstrap'][1] for _ in range(3)) / 1000
+    assert milliseconds < MAX_MS
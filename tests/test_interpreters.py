@@ -0,0 +1,43 @@
+"""
+The state kept per Tcl interpreter is released when the root window is destroyed. Destroying a root window needs a
+display, so the ``<Destroy>`` event of the root window is simulated.
+"""
+import tkinter
+
+from ttkbootstrap import ImageCache, StylerTK, ThemeRegistry, _forget_interpreter
+from ttkbootstrap.dispatch import Dispatcher, _root_destroyed
+
+
+def destroy_event(widget):
+    event = tkinter.Event()
+    event.widget = widget
+    return event
+
+
+def test_the_state_of_a_destroyed_interpreter_is_forgotten(master, monkeypatch):
+    monkeypatch.setattr(ImageCache, '_render', staticmethod(lambda master, name, shape, color, size: name))
+    registry = ThemeRegistry.get(master)
+    ImageCache.acquire(master, 'square', '#ff0000', 16)
+    StylerTK._active_options[master.tk] = {}
+    other = tkinter.Tcl()
+    try:
+        ThemeRegistry.get(other)
+        # the events of the children of the root window are ignored
+        _forget_interpreter(destroy_event('.frame'))
+        assert ThemeRegistry.get(master) is registry
+        _forget_interpreter(destroy_event(master))
+        assert master.tk not in ThemeRegistry._interps
+        assert master.tk not in ImageCache._interps
+        assert master.tk not in StylerTK._active_options
+        assert other.tk in ThemeRegistry._interps
+    finally:
+        ThemeRegistry._interps.pop(other.tk, None)
+
+
+def test_the_dispatcher_of_a_destroyed_interpreter_is_closed(master):
+    dispatcher = Dispatcher.get(master)
+    _root_destroyed(destroy_event('.frame'))
+    assert Dispatcher.get(master) is dispatcher
+    _root_destroyed(destroy_event(master))
+    assert master.tk not in Dispatcher._interps
+    assert dispatcher._pipe is None
@@ -0,0 +1,103 @@
+import pytest
+
+from ttkbootstrap import Colors, StylerTTK, ThemeCache, ThemeDefinition
+
+
+def definition(**colors):
+    return ThemeDefinition(name='test', themetype='light', font='helvetica', colors=Colors(**colors))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ThemeCache(tmp_path / 'cache')
+
+
+def test_default_path(monkeypatch, tmp_path):
+    monkeypatch.setenv('TTKBOOTSTRAP_CACHE_DIR', str(tmp_path))
+    assert ThemeCache().path == tmp_path
+
+
+def test_key_is_stable():
+    assert ThemeCache.key(definition(primary='#336699')) == ThemeCache.key(definition(primary='#336699'))
+    assert ThemeCache.key(definition(), xpnative=True) == ThemeCache.key(definition(), xpnative=True)
+
+
+@pytest.mark.parametrize('change', [
+    lambda d: d.colors.set('primary', '#336699'),
+    lambda d: d.colors.set('inputfg', '#000001'),
+    lambda d: setattr(d, 'name', 'other'),
+    lambda d: setattr(d, 'type', 'dark'),
+    lambda d: setattr(d, 'font', 'courier')])
+def test_key_changes_with_the_definition(change):
+    changed = definition()
+    change(changed)
+    assert ThemeCache.key(changed) != ThemeCache.key(definition())
+
+
+def test_key_changes_with_the_extra_values():
+    assert ThemeCache.key(definition(), xpnative=True) != ThemeCache.key(definition(), xpnative=False)
+
+
+def test_key_changes_with_the_format(monkeypatch):
+    key = ThemeCache.key(definition())
+    monkeypatch.setattr(ThemeCache, 'format', ThemeCache.format + 1)
+    assert ThemeCache.key(definition()) != key
+
+
+def test_key_changes_with_the_code(monkeypatch):
+    key = ThemeCache.key(definition())
+    monkeypatch.setattr(ThemeCache, 'code_fingerprint', staticmethod(lambda: 'changed'))
+    assert ThemeCache.key(definition()) != key
+
+
+def test_code_fingerprint_changes_with_the_styling_code(monkeypatch):
+    # the fingerprint is computed once per process, so the undecorated function is called
+    fingerprint = ThemeCache.code_fingerprint()
+    assert ThemeCache.code_fingerprint.__wrapped__() == fingerprint
+    monkeypatch.setattr(StylerTTK, 'class_families', {**StylerTTK.class_families, 'Test': 'test'})
+    assert ThemeCache.code_fingerprint.__wrapped__() != fingerprint
+    assert ThemeCache.code_fingerprint.__wrapped__() == ThemeCache.code_fingerprint.__wrapped__()
+
+
+def test_load_missing_entry(cache):
+    assert cache.load('test', ThemeCache.key(definition())) is None
+
+
+def test_store_and_load(cache):
+    key = ThemeCache.key(definition())
+    cache.store('test', key, {'settings': {'TButton': {'configure': {'padding': [1, 2]}}}})
+    assert cache.load('test', key) == {'settings': {'TButton': {'configure': {'padding': [1, 2]}}}}
+    assert cache.load('test', ThemeCache.key(definition(primary='#336699'))) is None
+
+
+def test_store_removes_stale_entries(cache):
+    old_key = ThemeCache.key(definition())
+    new_key = ThemeCache.key(definition(primary='#336699'))
+    cache.store('test', old_key, {'version': 1})
+    cache.store('test.other', old_key, {'version': 1})
+    cache.store('test', new_key, {'version': 2})
+    assert cache.load('test', old_key) is None
+    assert cache.load('test', new_key) == {'version': 2}
+    assert cache.load('test.other', old_key) == {'version': 1}
+    assert not list(cache.path.glob('*.tmp'))
+
+
+def test_load_corrupt_entry(cache):
+    key = ThemeCache.key(definition())
+    cache.store('test', key, {'version': 1})
+    next(cache.path.glob('test-*.json')).write_text('{"version": ', encoding='utf-8')
+    assert cache.load('test', key) is None
+
+
+def test_store_is_not_an_error_when_the_cache_is_not_writable(tmp_path):
+    (tmp_path / 'file').write_text('', encoding='utf-8')
+    cache = ThemeCache(tmp_path / 'file' / 'cache')
+    cache.store('test', ThemeCache.key(definition()), {'version': 1})
+    assert cache.load('test', ThemeCache.key(definition())) is None
+
+
+def test_clear(cache):
+    for name in ('one', 'two'):
+        cache.store(name, ThemeCache.key(definition()), {'version': 1})
+    cache.clear()
+    assert not list(cache.path.glob('*.json'))
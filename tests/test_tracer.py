@@ -0,0 +1,79 @@
+import tkinter
+
+import pytest
+
+from ttkbootstrap import TclTracer, _TracedInterpreter
+from ttkbootstrap.dispatch import Dispatcher
+
+
+def test_counts_commands(master):
+    with TclTracer(master) as tracer:
+        master.tk.call('set', 'x', 1)
+        master.tk.call('set', 'y', 2)
+        master.tk.call('string', 'length', 'abc')
+        master.tk.call(('info', 'exists', 'x'))
+        master.tk.eval('set z 3')
+        master.setvar('x', 4)
+    assert {name: command['calls'] for name, command in tracer.commands.items()} == {
+        'set': 2, 'string length': 1, 'info exists': 1, 'eval': 1, 'setvar': 1}
+    assert tracer.total == 6
+
+
+def test_command_names():
+    assert _TracedInterpreter._command_name('call', ('.frame.button', 'configure', '-text')) == '<widget> configure'
+    assert _TracedInterpreter._command_name('call', ('ttk::style', 'configure', 'TButton')) == 'ttk::style configure'
+    assert _TracedInterpreter._command_name('call', ('set', 'name', 'value')) == 'set'
+    assert _TracedInterpreter._command_name('call', ()) == ''
+
+
+def test_variables_are_traced(master):
+    variable = tkinter.StringVar(master)
+    with TclTracer(master) as tracer:
+        variable.set('value')
+        assert variable.get() == 'value'
+    assert tracer.total == 2
+    variable.set('untraced')
+    assert tracer.total == 2
+
+
+def test_the_interpreter_is_restored(master):
+    tk = master.tk
+    with TclTracer(master):
+        assert master.tk is not tk
+        assert master.tk == tk and hash(master.tk) == hash(tk)
+        assert {tk: 'state'}.get(master.tk) == 'state'
+    assert master.tk is tk
+    with pytest.raises(ZeroDivisionError):
+        with TclTracer(master):
+            1 / 0
+    assert master.tk is tk
+
+
+def test_tracers_cannot_be_nested(master):
+    with TclTracer(master):
+        with pytest.raises(RuntimeError):
+            with TclTracer(master):
+                pass
+
+
+def test_report(master):
+    with TclTracer(master) as tracer:
+        master.tk.call('set', 'x', 1)
+        master.tk.call('set', 'x', 2)
+        master.tk.call('incr', 'x')
+    report = tracer.report()
+    assert report['calls'] == 3
+    assert report['commands']['set']['calls'] == 2
+    assert report['seconds'] == pytest.approx(sum(command['seconds'] for command in report['commands'].values()))
+    lines = tracer.format_report().splitlines()
+    assert lines[1].split()[:2] == ['set', '2']
+    assert lines[-1].split()[:2] == ['total', '3']
+
+
+def test_state_of_the_interpreter_is_found_while_traced(master):
+    dispatcher = Dispatcher.get(master)
+    with TclTracer(master):
+        assert Dispatcher.get(master) is dispatcher
+        variable = tkinter.StringVar(master)
+    # objects created while tracing get the original interpreter back on exit
+    assert variable._tk is master.tk